@@ -105,7 +105,9 @@ def problinsolve(
         User-supplied function called after each iteration of the linear solver. It is
         called as ``callback(xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs)`` and can
         be used to return quantities from the iteration. Note that depending on the
-        function supplied, this can slow down the solver considerably.
+        function supplied, this can slow down the solver considerably. Each of the
+        posterior beliefs ``xk``, ``Ak`` and ``Ainvk`` is only computed if it is an
+        explicit parameter of the callback, otherwise ``None`` is passed for it.
     kwargs : optional
         Optional keyword arguments passed onto the solver iteration.
 
@@ -4,15 +4,314 @@ Implementations of matrix-based linear solvers which perform inference
 on the matrix or its inverse given linear observations.
 """
 import abc
+import concurrent.futures
+import functools
+import inspect
 import warnings
+import weakref
 
 import numpy as np
+import scipy.linalg
+import scipy.sparse
+import scipy.special
 
 from probnum import linops, randvars
 
 # pylint: disable="too-many-branches,too-many-lines,too-complex,too-many-statements,redefined-builtin,arguments-differ,abstract-method,unused-argument"
 
 
+def _dense_iteration_step(
+    A,
+    A_mean,
+    Ainv_mean,
+    A_covfactor,
+    Ainv_covfactor,
+    x,
+    resid,
+    S,
+    Y,
+    sy,
+    ss,
+    U_A,
+    V_A,
+    Vs,
+    U_Ainv,
+    V_Ainv,
+    Wy,
+    k,
+    step_tol,
+):
+    """Single iteration of :class:`SymmetricMatrixBasedSolver` for dense parameters.
+
+    The means, covariance factors, solution estimate and residual are updated in-place.
+    The search direction, observation and update vectors are written into the ``k``-th
+    columns of the (column-major) buffers, see
+    :meth:`SymmetricMatrixBasedSolver._store_observation` and
+    :meth:`SymmetricMatrixBasedSolver._store_update`. Written such that it can be
+    compiled with :mod:`numba`, see :func:`_jit_dense_iteration_step`.
+
+    If the search direction has zero curvature :math:`s^\\top A s` or the norm of the
+    step is at most ``step_tol`` (see
+    :meth:`SymmetricMatrixBasedSolver._step_stagnated`), nothing is updated and the
+    last return value is ``False``.
+    """
+    # Search direction, observation and step size
+    search_dir = -(Ainv_mean @ resid)
+    obs = A @ search_dir
+    s_y = search_dir @ obs
+
+    if s_y == 0.0:
+        return 0.0, s_y, 0.0, False
+
+    step_size = -(search_dir @ resid) / s_y
+
+    if abs(step_size) * np.linalg.norm(search_dir) <= step_tol:
+        return step_size, s_y, 0.0, False
+
+    # Step and residual update (r = Ax - b is updated via the recurrence
+    # r += alpha * As, since As is already observed)
+    n = x.shape[0]
+    for i in range(n):
+        x[i] += step_size * search_dir[i]
+        resid[i] += step_size * obs[i]
+
+    # (Symmetric) mean and covariance updates
+    Vs_k = A_covfactor @ search_dir
+    delta_A = obs - A_mean @ search_dir
+    u_A = Vs_k / (search_dir @ Vs_k)
+    v_A = delta_A - 0.5 * (search_dir @ delta_A) * u_A
+
+    Wy_k = Ainv_covfactor @ obs
+    delta_Ainv = search_dir - Ainv_mean @ obs
+    yWy = obs @ Wy_k
+    u_Ainv = Wy_k / yWy
+    v_Ainv = delta_Ainv - 0.5 * (obs @ delta_Ainv) * u_Ainv
+
+    # Rank 2 mean updates (+= uv' + vu') and rank 1 covariance factor updates
+    # (-= u_A(Vs)' and -= u_Ainv(Wy)') in a single sweep over the (column-major)
+    # matrices
+    for j in range(n):
+        for i in range(n):
+            A_mean[i, j] += u_A[i] * v_A[j] + v_A[i] * u_A[j]
+            Ainv_mean[i, j] += u_Ainv[i] * v_Ainv[j] + v_Ainv[i] * u_Ainv[j]
+            A_covfactor[i, j] -= u_A[i] * Vs_k[j]
+            Ainv_covfactor[i, j] -= u_Ainv[i] * Wy_k[j]
+
+    # Store the observation and the update vectors
+    sy[k] = s_y
+    ss[k] = search_dir @ search_dir
+    for i in range(n):
+        S[i, k] = search_dir[i]
+        Y[i, k] = obs[i]
+        U_A[i, k] = u_A[i]
+        V_A[i, k] = v_A[i]
+        Vs[i, k] = Vs_k[i]
+        U_Ainv[i, k] = u_Ainv[i]
+        V_Ainv[i, k] = v_Ainv[i]
+        Wy[i, k] = Wy_k[i]
+
+    return step_size, s_y, yWy, True
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_dense_iteration_step():
+    """Compile :func:`_dense_iteration_step` with :mod:`numba`."""
+    try:
+        import numba  # pylint: disable=import-outside-toplevel
+    except ImportError as err:
+        raise ImportError(
+            "Cannot JIT-compile the solver iteration without optional dependency "
+            "numba. Try installing numba via `pip install numba`."
+        ) from err
+
+    return numba.njit(cache=True)(_dense_iteration_step)
+
+
+@functools.lru_cache(maxsize=None)
+def _matvec_thread_pool():
+    """Worker thread evaluating matrix-vector products concurrently with the main
+    thread."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+
+def _inverse_operator(M):
+    """Inverse of a dense symmetric prior mean as a linear operator.
+
+    The inverse is applied via a Cholesky factorization of ``M`` instead of being
+    formed explicitly. If ``M`` is not positive definite, an LU factorization is used
+    instead.
+    """
+    M = np.asarray(M)
+
+    try:
+        M_cho = scipy.linalg.cho_factor(M, lower=True)
+        solve = functools.partial(scipy.linalg.cho_solve, M_cho)
+    except np.linalg.LinAlgError:
+        M_lu = scipy.linalg.lu_factor(M)
+        solve = functools.partial(scipy.linalg.lu_solve, M_lu)
+
+    Minv = linops.LinearOperator(
+        shape=M.shape,
+        dtype=np.result_type(M.dtype, np.double),
+        matmul=linops.LinearOperator.broadcast_matmat(solve),
+        transpose=lambda: Minv,
+    )
+
+    return Minv
+
+
+# Inverses of prior means of random variable priors, which are reused when the same
+# prior is passed to several solvers
+_PRIOR_MEAN_INVERSES = weakref.WeakKeyDictionary()
+
+
+def _prior_mean_inverse_operator(prior, mean):
+    """Inverse of the mean of a prior as a linear operator (see
+    :func:`_inverse_operator`), which is cached for random variable priors."""
+    if not isinstance(prior, randvars.RandomVariable):
+        return _inverse_operator(mean)
+
+    try:
+        return _PRIOR_MEAN_INVERSES[prior]
+    except KeyError:
+        Minv = _inverse_operator(mean)
+        _PRIOR_MEAN_INVERSES[prior] = Minv
+        return Minv
+
+
+class _SymmetricLowRank(linops.LinearOperator):
+    """Symmetric low-rank linear operator :math:`U \\operatorname{diag}(w) U^\\top`.
+
+    Parameters
+    ----------
+    U : np.ndarray, shape=(n, k)
+        Factor of the low-rank operator.
+    weights : np.ndarray, shape=(k,), optional
+        Weights :math:`w` of the columns of ``U``. Defaults to all ones.
+    """
+
+    def __init__(self, U, weights=None):
+        self._U = U
+        self._wUT = U.T if weights is None else weights[:, None] * U.T
+
+        super().__init__(
+            shape=(U.shape[0], U.shape[0]),
+            dtype=np.result_type(U.dtype, self._wUT.dtype),
+            matmul=lambda x: self._U @ (self._wUT @ x),
+            todense=lambda: self._U @ self._wUT,
+            transpose=lambda: self,
+            trace=lambda: np.sum(self._U * self._wUT.T),
+        )
+
+
+class _LowRankUpdate(linops.LinearOperator):
+    """Low-rank update :math:`B + c UV^\\top` or, if ``symmetric``, the symmetric
+    low-rank update :math:`B + c (UV^\\top + VU^\\top)` of a symmetric matrix
+    :math:`B`.
+
+    The update vectors are stored column-wise, such that the update is applied with a
+    fixed number of matrix products irrespective of the number of updates.
+
+    Parameters
+    ----------
+    base : np.ndarray or scipy.sparse.spmatrix or LinearOperator, shape=(n, n)
+        Symmetric matrix :math:`B` which is updated.
+    U : np.ndarray, shape=(n, k)
+        Update vectors :math:`U`.
+    V : np.ndarray, shape=(n, k)
+        Update vectors :math:`V`.
+    scale : float, default=1.0
+        Scale :math:`c` of the update.
+    symmetric : bool, default=False
+        Whether the update is symmetrized.
+    """
+
+    def __init__(self, base, U, V, scale=1.0, symmetric=False):
+        self._base = base
+        self._U = U
+        self._V = V
+        self._scale = scale
+        self._symmetric = symmetric
+
+        super().__init__(
+            shape=base.shape,
+            dtype=np.result_type(base.dtype, U.dtype, V.dtype),
+            matmul=self._matmul,
+            rmatmul=self._rmatmul,
+            todense=self._todense,
+            transpose=(lambda: self) if symmetric else None,
+            trace=self._trace,
+        )
+
+    def _matmul(self, x):
+        update = self._U @ (self._V.T @ x)
+        if self._symmetric:
+            update += self._V @ (self._U.T @ x)
+
+        return self._base @ x + self._scale * update
+
+    def _rmatmul(self, x):
+        update = (x @ self._U) @ self._V.T
+        if self._symmetric:
+            update += (x @ self._V) @ self._U.T
+
+        return x @ self._base + self._scale * update
+
+    def _todense(self):
+        update = self._U @ self._V.T
+        if self._symmetric:
+            update += update.T
+
+        return linops.aslinop(self._base).todense(cache=False) + self._scale * update
+
+    def _trace(self):
+        trace_update = np.sum(self._U * self._V)
+        if self._symmetric:
+            trace_update *= 2
+
+        return linops.aslinop(self._base).trace() + self._scale * trace_update
+
+
+class _NullSpaceProjection(linops.LinearOperator):
+    """Scaled orthogonal projection :math:`c (I - V(V^\\top V)^{-1}V^\\top)` onto the
+    orthogonal complement of the span of the columns of :math:`V`.
+
+    If the Gram matrix :math:`V^\\top V` is singular, the operator is zero.
+
+    Parameters
+    ----------
+    V : np.ndarray, shape=(n, k)
+        Basis vectors.
+    scale : float
+        Scale :math:`c` of the projection.
+    """
+
+    def __init__(self, V, scale):
+        self._V = V
+        self._scale = scale
+
+        # Factorize the Gram matrix once instead of on every application
+        try:
+            self._VVinvVT = scipy.linalg.cho_solve(
+                scipy.linalg.cho_factor(V.T @ V, lower=True), V.T
+            )
+        except np.linalg.LinAlgError:
+            self._VVinvVT = None
+
+        super().__init__(
+            shape=(V.shape[0], V.shape[0]),
+            dtype=V.dtype,
+            matmul=self._matmul,
+            transpose=lambda: self,
+        )
+
+    def _matmul(self, x):
+        if self._VVinvVT is None:
+            return np.zeros_like(x, dtype=np.result_type(self.dtype, x.dtype))
+
+        return self._scale * (x - self._V @ (self._VVinvVT @ x))
+
+
 class MatrixBasedSolver(abc.ABC):
     """Abstract class for matrix-based probabilistic linear solvers.
 
@@ -86,7 +385,7 @@ class MatrixBasedSolver(abc.ABC):
         # Check inner product between x0 and b; if negative or zero, choose better
         # initialization
         bx0 = np.squeeze(b.T @ x0)
-        bb = np.linalg.norm(b) ** 2
+        bb = np.squeeze(b.T @ b)
         if bx0 < 0:
             x0 = -x0
             bx0 = -bx0
@@ -104,22 +403,30 @@ class MatrixBasedSolver(abc.ABC):
         # Construct prior mean of A and H
         alpha = 0.5 * bx0 / bb
 
+        # Both prior means are rank 1 updates of a scaled identity with the same
+        # outer product ww'
+        w = x0 - alpha * b
+        wx0 = np.squeeze(w.T @ x0)
+
         def _matmul(M):
-            return (x0 - alpha * b) @ (x0 - alpha * b).T @ M
+            return w @ (w.T @ M)
+
+        def _rmatmul(M):
+            return (M @ w) @ w.T
 
-        Ainv0_mean = linops.Scaling(
-            alpha, shape=(self.n, self.n)
-        ) + 2 / bx0 * linops.LinearOperator(
+        wwT = linops.LinearOperator(
             shape=(self.n, self.n),
             dtype=np.result_type(x0.dtype, alpha.dtype, b.dtype),
             matmul=_matmul,
+            rmatmul=_rmatmul,
+            todense=lambda: w @ w.T,
+            transpose=lambda: wwT,
+            trace=lambda: np.squeeze(w.T @ w),
         )
-        A0_mean = linops.Scaling(1 / alpha, shape=(self.n, self.n)) - 1 / (
-            alpha * np.squeeze((x0 - alpha * b).T @ x0)
-        ) * linops.LinearOperator(
-            shape=(self.n, self.n),
-            dtype=np.result_type(x0.dtype, alpha.dtype, b.dtype),
-            matmul=_matmul,
+
+        Ainv0_mean = linops.Scaling(alpha, shape=(self.n, self.n)) + 2 / bx0 * wwT
+        A0_mean = (
+            linops.Scaling(1 / alpha, shape=(self.n, self.n)) - 1 / (alpha * wx0) * wwT
         )
         return A0_mean, Ainv0_mean
 
@@ -205,6 +512,12 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
     x0 : array-like, or RandomVariable, shape=(n,) or (n, nrhs)
         Optional. Prior belief for the solution of the linear system. Will be ignored if
         ``Ainv0`` is given.
+    parallel_matvecs : bool, default=False
+        If ``True`` and :math:`n \\geq 512`, the (independent) products with the beliefs
+        about :math:`A` and :math:`H` in each iteration are evaluated concurrently in
+        two threads. This only pays off on multiple cores if the BLAS library does not
+        already use them, since the threads compete with those of the BLAS library
+        otherwise.
 
     Returns
     -------
@@ -230,7 +543,7 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
         Class implementing the noisy symmetric probabilistic linear solver.
     """
 
-    def __init__(self, A, b, A0=None, Ainv0=None, x0=None):
+    def __init__(self, A, b, A0=None, Ainv0=None, x0=None, parallel_matvecs=False):
 
         # Assume constant right hand side
         if isinstance(b, randvars.RandomVariable):
@@ -240,6 +553,11 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
 
         super().__init__(A=A, b=_b, x0=x0)
 
+        # Norm of the right hand side for relative convergence criteria
+        self._b_norm = np.linalg.norm(self.b)
+
+        self._parallel_matvecs = parallel_matvecs
+
         # Get or construct prior parameters
         A_mean0, A_covfactor0, Ainv_mean0, Ainv_covfactor0 = self._get_prior_params(
             A0=A0, Ainv0=Ainv0, x0=self.x0, b=self.b
@@ -262,10 +580,28 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
             raise NotImplementedError
         self.x0 = self.x_mean
 
-        # Computed search directions and observations
-        self.search_dir_list = []
-        self.obs_list = []
-        self.sy = []
+        # Computed search directions, observations and their inner products (stored
+        # column-wise in preallocated buffers, see `_store_observation`)
+        self._S = np.empty((self.n, 0), order="F")
+        self._Y = np.empty((self.n, 0), order="F")
+        self._sy = np.empty((0,))
+        self._ss = np.empty((0,))
+        self._num_obs = 0
+
+        # Products of the prior mean of the inverse with the observations, computed
+        # only if needed, see `_compute_trace_Ainv_covfactor0`
+        self._Ainv_mean0_Y = np.empty((self.n, 0), order="F")
+        self._num_Ainv_mean0_Y = 0
+
+        # Vectors of the low-rank mean and covariance factor updates (stored
+        # column-wise, see `_store_update`)
+        self._U_A = np.empty((self.n, 0), order="F")
+        self._V_A = np.empty((self.n, 0), order="F")
+        self._Vs = np.empty((self.n, 0), order="F")
+        self._U_Ainv = np.empty((self.n, 0), order="F")
+        self._V_Ainv = np.empty((self.n, 0), order="F")
+        self._Wy = np.empty((self.n, 0), order="F")
+        self._num_updates = 0
 
     def _get_prior_params(self, A0, Ainv0, x0, b):
         """Get the parameters of the matrix priors on A and H.
@@ -348,7 +684,7 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
                     "This operation is computationally costly! Specify an inverse "
                     "prior (mean) instead."
                 )
-                A0_mean = np.linalg.inv(Ainv0.mean)
+                A0_mean = _prior_mean_inverse_operator(Ainv0, Ainv0_mean)
             except NotImplementedError:
                 A0_mean = linops.Identity(self.n)
                 warnings.warn(
@@ -381,7 +717,7 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
                     "This operation is computationally costly! "
                     "Specify an inverse prior (mean)."
                 )
-                Ainv0_mean = np.linalg.inv(A0.mean)
+                Ainv0_mean = _prior_mean_inverse_operator(A0, A0_mean)
             except NotImplementedError:
                 Ainv0_mean = linops.Identity(self.n)
                 warnings.warn(
@@ -438,15 +774,19 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
         else:
             # General prior mean
             if self.is_calib_covclass and k > 0 and unc_scale != 0:
-                # General prior mean with calibration covariance class
-                _trace = np.trace(
-                    np.linalg.solve(
-                        Y.T @ self.Ainv_mean0 @ Y,
-                        Y.T @ self.Ainv_mean0 @ self.Ainv_mean0 @ Y,
+                # General prior mean with calibration covariance class. The products
+                # of the (symmetric) prior mean with the observations are computed
+                # only once per observation.
+                num_cached = self._num_Ainv_mean0_Y
+                if num_cached < k:
+                    self._Ainv_mean0_Y[:, num_cached:k] = (
+                        self.Ainv_mean0 @ Y[:, num_cached:k]
                     )
-                )
+                    self._num_Ainv_mean0_Y = k
+                H0Y = self._Ainv_mean0_Y[:, :k]
+                _trace = np.trace(np.linalg.solve(Y.T @ H0Y, H0Y.T @ H0Y))
             else:
-                _trace = self.Ainv_covfactor0.trace()
+                _trace = self._Ainv_covfactor0_trace
         if self.is_calib_covclass:
             # Additive term from uncertainty calibration
             _trace += unc_scale * (self.n - k)
@@ -469,8 +809,12 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
         trace_x_cov : float
             Trace of solution covariance.
         """
-        # Trace of inverse covariance factor after k iterations
-        return 0.5 * (bWb * self.trace_Ainv_covfactor + np.linalg.norm(Wb, ord=2) ** 2)
+        # Trace of inverse covariance factor after k iterations (in double precision
+        # for lower precision covariance factors)
+        return 0.5 * (
+            bWb * self.trace_Ainv_covfactor
+            + np.sum(Wb.astype(np.double, copy=False) ** 2)
+        )
 
     def has_converged(self, iter, maxiter, resid=None, atol=None, rtol=None):
         """Check convergence of a linear solver.
@@ -509,20 +853,24 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
             return True, "maxiter"
         # residual below error tolerance
         resid_norm = np.linalg.norm(resid)
-        b_norm = np.linalg.norm(self.b)
+        rtol_b_norm = rtol * self._b_norm
         if resid_norm <= atol:
             return True, "resid_atol"
-        elif resid_norm <= rtol * b_norm:
+        elif resid_norm <= rtol_b_norm:
             return True, "resid_rtol"
-        # uncertainty-based
-        if np.sqrt(self.trace_sol_cov) <= atol:
+        # uncertainty-based (only if the trace of the solution covariance is not
+        # dominated by rounding errors, see `_get_output_randvars`)
+        if not self._trace_sol_cov_resolved:
+            return False, ""
+        sol_std = np.sqrt(self.trace_sol_cov)
+        if sol_std <= atol:
             return True, "tracecov_atol"
-        elif np.sqrt(self.trace_sol_cov) <= rtol * b_norm:
+        elif sol_std <= rtol_b_norm:
             return True, "tracecov_rtol"
         else:
             return False, ""
 
-    def _calibrate_uncertainty(self, S, sy, method):
+    def _calibrate_uncertainty(self, ss, sy, method):
         """Calibrate uncertainty based on the Rayleigh coefficients.
 
         A regression model for the log-Rayleigh coefficient is built based on the
@@ -532,8 +880,8 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
 
         Parameters
         ----------
-        S : np.ndarray, shape=(n, k)
-            Array of search directions
+        ss : np.ndarray
+            Array of squared norms ``s_i's_i`` of the search directions
         sy : np.ndarray
             Array of inner products ``s_i'As_i``
         method : str
@@ -555,7 +903,7 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
 
         # Rayleigh quotient
         iters = np.arange(self.iter_ + 1)
-        logR = np.log(sy) - np.log(np.einsum("nk,nk->k", S, S))
+        logR = np.log(sy / ss)
 
         # only calibrate if enough iterations for a regression model have been performed
         if self.iter_ > 1:
@@ -563,37 +911,52 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
                 logR_pred = logR[-1]
             elif method == "weightedmean":
                 deprecation_rate = 0.9
-                logR_pred = logR * np.repeat(
-                    deprecation_rate, self.iter_ + 1
-                ) ** np.arange(self.iter_ + 1)
+                logR_pred = logR * deprecation_rate ** iters
             elif method == "gpkern":
-                try:
-                    import GPy  # pylint: disable=import-outside-toplevel
-
-                    # GP mean function via Weyl's result on spectra of Gram matrices for
-                    # differentiable kernels
-                    # ln(sigma(n)) ~= theta_0 - theta_1 ln(n)
-                    lnmap = GPy.core.Mapping(1, 1)
-                    lnmap.f = lambda n: np.log(n + 10 ** -16)
-                    lnmap.update_gradients = lambda a, b: None
-                    mf = GPy.mappings.Additive(
-                        GPy.mappings.Constant(1, 1, value=0),
-                        GPy.mappings.Compound(lnmap, GPy.mappings.Linear(1, 1)),
+                # The regression only enters the calibration through the mean of its
+                # predictions, so single precision suffices
+                n_obs = (iters + 1).astype(np.float32)
+                logR_obs = logR.astype(np.float32)
+
+                # GP mean function via Weyl's result on spectra of Gram matrices for
+                # differentiable kernels
+                # ln(sigma(n)) ~= theta_0 - theta_1 ln(n)
+                # fitted in closed form
+                theta_0, theta_1 = self._fit_log_rayleigh_trend(n_obs, logR_obs)
+
+                # Predict the mean Rayleigh quotient over the remaining dimensions
+                # m = k+1, ..., n via the GP posterior mean of the residuals of the
+                # trend (RBF kernel, unit lengthscale, variance and noise). Only the
+                # mean of the prediction is needed, so the trend is averaged in closed
+                # form via sum_m ln(m) = ln(n!) - ln(k!)
+                num_remaining = self.n - self.iter_
+                if num_remaining > 0:
+                    mean_log_dims = (
+                        scipy.special.gammaln(self.n + 1)
+                        - scipy.special.gammaln(self.iter_ + 1)
+                    ) / num_remaining
+
+                    # The RBF kernel vanishes (numerically) a few lengthscales away from
+                    # the observations, so does the GP posterior mean of the residuals
+                    near_dims = np.arange(
+                        self.iter_ + 1,
+                        min(self.iter_ + 1 + 32, self.n + 1),
+                        dtype=np.float32,
                     )
-                    k = GPy.kern.RBF(input_dim=1, lengthscale=1, variance=1)
-                    m = GPy.models.GPRegression(
-                        iters[:, None] + 1, logR[:, None], kernel=k, mean_function=mf
+                    logR_pred = (
+                        theta_0
+                        + theta_1 * mean_log_dims
+                        + np.sum(
+                            self._rbf_gp_posterior_mean(
+                                x=n_obs,
+                                y=logR_obs - (theta_0 + theta_1 * np.log(n_obs)),
+                                x_pred=near_dims,
+                            )
+                        )
+                        / num_remaining
                     )
-                    m.optimize(messages=False)
-
-                    # Predict Rayleigh quotient
-                    remaining_dims = np.arange(self.iter_, self.A.shape[0])[:, None]
-                    logR_pred = m.predict(remaining_dims + 1)[0].ravel()
-                except ImportError as err:
-                    raise ImportError(
-                        "Cannot perform GP-based calibration without optional "
-                        "dependency GPy. Try installing GPy via `pip install GPy`."
-                    ) from err
+                else:
+                    logR_pred = logR[-1]
             else:
                 raise ValueError("Calibration method not recognized.")
 
@@ -607,89 +970,231 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
 
         return Phi, Psi
 
+    @staticmethod
+    def _fit_log_rayleigh_trend(n, logR):
+        """Closed-form least-squares fit of ``logR ~= theta_0 + theta_1 ln(n)``.
+
+        Parameters
+        ----------
+        n : np.ndarray
+            Iteration numbers (starting at 1).
+        logR : np.ndarray
+            Log-Rayleigh coefficients of the iterations.
+
+        Returns
+        -------
+        theta_0 : float
+            Intercept.
+        theta_1 : float
+            Slope with respect to ``ln(n)``.
+        """
+        lnn = np.log(n)
+        k = lnn.shape[0]
+        sum_lnn = np.sum(lnn)
+        sum_logR = np.sum(logR)
+        denom = k * (lnn @ lnn) - sum_lnn ** 2
+        if denom == 0.0:
+            return sum_logR / k, 0.0
+        theta_1 = (k * (lnn @ logR) - sum_lnn * sum_logR) / denom
+        theta_0 = (sum_logR - theta_1 * sum_lnn) / k
+        return theta_0, theta_1
+
+    @staticmethod
+    def _rbf_gp_posterior_mean(x, y, x_pred, lengthscale=1.0, variance=1.0, noise=1.0):
+        """Posterior mean of a zero-mean GP with RBF kernel and Gaussian noise.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            Training inputs.
+        y : np.ndarray
+            Training targets.
+        x_pred : np.ndarray
+            Inputs at which to predict.
+        lengthscale : float
+            Lengthscale of the RBF kernel.
+        variance : float
+            Output variance of the RBF kernel.
+        noise : float
+            Variance of the Gaussian observation noise.
+        """
+
+        def _rbf(x0, x1):
+            return variance * np.exp(
+                -0.5 * ((x0[:, None] - x1[None, :]) / lengthscale) ** 2
+            )
+
+        gram_cho = scipy.linalg.cho_factor(
+            _rbf(x, x) + noise * np.eye(x.shape[0], dtype=x.dtype), lower=True
+        )
+        return _rbf(x_pred, x) @ scipy.linalg.cho_solve(gram_cho, y)
+
+    @property
+    def S(self):
+        """Search directions computed so far, stored column-wise."""
+        return self._S[:, : self._num_obs]
+
+    @property
+    def Y(self):
+        """Observations made so far, stored column-wise."""
+        return self._Y[:, : self._num_obs]
+
+    @property
+    def sy(self):
+        """Inner products :math:`s_i^\\top y_i` of search directions and
+        observations."""
+        return self._sy[: self._num_obs]
+
+    @property
+    def ss(self):
+        """Squared norms :math:`s_i^\\top s_i` of the search directions, i.e. the
+        diagonal of :math:`S^\\top S`."""
+        return self._ss[: self._num_obs]
+
+    def _covfactor_update(self, C0, view="A"):
+        """Covariance factor :math:`C_0 - WU^\\top` updated with all rank 1 updates
+        (-= u_A(Vs)' or -= u_Ainv(Wy)') of the given view made so far."""
+        k = self._num_updates
+        if view == "A":
+            return _LowRankUpdate(
+                self._unwrapped(C0), U=self._Vs[:, :k], V=self._U_A[:, :k], scale=-1.0
+            )
+
+        return _LowRankUpdate(
+            self._unwrapped(C0), U=self._Wy[:, :k], V=self._U_Ainv[:, :k], scale=-1.0
+        )
+
+    # Maximum number of entries of each preallocated buffer
+    _max_preallocated_buffer_size = 2 ** 21
+
+    # Minimum dimension from which the products with the beliefs about the matrix and
+    # its inverse are evaluated in two threads
+    _min_parallel_matvec_dim = 512
+
+    def _init_observation_buffers(self, maxiter):
+        """Allocate the buffers for the search directions and observations as well as
+        for the vectors of the low-rank parameter updates.
+
+        The buffers are preallocated for the maximum number of iterations, which in
+        exact arithmetic is at most ``n``, if this is cheap. Otherwise they start small
+        and grow geometrically.
+        """
+        capacity = max(min(maxiter, self.n), 1)
+        if self.n * capacity > self._max_preallocated_buffer_size:
+            capacity = min(capacity, 16)
+
+        self._S = np.empty((self.n, capacity), order="F")
+        self._Y = np.empty((self.n, capacity), order="F")
+        self._sy = np.empty((capacity,))
+        self._ss = np.empty((capacity,))
+        self._num_obs = 0
+
+        self._Ainv_mean0_Y = np.empty((self.n, capacity), order="F")
+        self._num_Ainv_mean0_Y = 0
+
+        self._U_A = np.empty((self.n, capacity), order="F")
+        self._V_A = np.empty((self.n, capacity), order="F")
+        self._Vs = np.empty((self.n, capacity), order="F")
+        self._U_Ainv = np.empty((self.n, capacity), order="F")
+        self._V_Ainv = np.empty((self.n, capacity), order="F")
+        self._Wy = np.empty((self.n, capacity), order="F")
+        self._num_updates = 0
+
+    @staticmethod
+    def _grown(buffer, num):
+        """Copy of the first ``num`` entries (along the last axis) of a buffer into a
+        buffer of twice the capacity."""
+        grown = np.empty(
+            buffer.shape[:-1] + (max(2 * num, 1),), dtype=buffer.dtype, order="F"
+        )
+        grown[..., :num] = buffer[..., :num]
+        return grown
+
+    def _reserve_buffer_columns(self):
+        """Grow the buffers geometrically if their next columns are not allocated."""
+        if self._num_obs == self._sy.shape[0]:
+            self._S = self._grown(self._S, self._num_obs)
+            self._Y = self._grown(self._Y, self._num_obs)
+            self._sy = self._grown(self._sy, self._num_obs)
+            self._ss = self._grown(self._ss, self._num_obs)
+            self._Ainv_mean0_Y = self._grown(self._Ainv_mean0_Y, self._num_obs)
+
+        if self._num_updates == self._U_A.shape[1]:
+            self._U_A = self._grown(self._U_A, self._num_updates)
+            self._V_A = self._grown(self._V_A, self._num_updates)
+            self._Vs = self._grown(self._Vs, self._num_updates)
+            self._U_Ainv = self._grown(self._U_Ainv, self._num_updates)
+            self._V_Ainv = self._grown(self._V_Ainv, self._num_updates)
+            self._Wy = self._grown(self._Wy, self._num_updates)
+
+    def _store_observation(self, search_dir, obs, sy):
+        """Write a search direction, its observation and their inner products into the
+        next columns of the buffers."""
+        self._reserve_buffer_columns()
+
+        search_dir = np.ravel(search_dir)
+        self._S[:, self._num_obs] = search_dir
+        self._Y[:, self._num_obs] = np.ravel(obs)
+        self._sy[self._num_obs] = sy
+        # Computed once per search direction instead of per calibration
+        self._ss[self._num_obs] = search_dir @ search_dir
+        self._num_obs += 1
+
+    def _store_update(self, u_A, v_A, Vs, u_Ainv, v_Ainv, Wy):
+        """Write the vectors of the rank 2 mean updates (+= uv' + vu') and the rank 1
+        covariance factor updates (-= u(Ws)') into the next columns of the buffers."""
+        self._reserve_buffer_columns()
+
+        self._U_A[:, self._num_updates] = np.ravel(u_A)
+        self._V_A[:, self._num_updates] = np.ravel(v_A)
+        self._Vs[:, self._num_updates] = np.ravel(Vs)
+        self._U_Ainv[:, self._num_updates] = np.ravel(u_Ainv)
+        self._V_Ainv[:, self._num_updates] = np.ravel(v_Ainv)
+        self._Wy[:, self._num_updates] = np.ravel(Wy)
+        self._num_updates += 1
+
     def _get_calibration_covariance_update_terms(self, phi=None, psi=None):
         """For the calibration covariance class set the calibration update terms of the
         covariance in the null spaces of span(S) and span(Y) based on the degrees of
         freedom."""
-        # Search directions and observations as arrays
-        S = np.hstack(self.search_dir_list)
-        Y = np.hstack(self.obs_list)
-
-        def get_null_space_map(V, unc_scale):
-            """Returns a function mapping to the null space of span(V), scaling with a
-            single degree of freedom and mapping back."""
-
-            def null_space_proj(x):
-                try:
-                    VVinvVx = np.linalg.solve(V.T @ V, V.T @ x)
-                    return x - V @ VVinvVx
-                except np.linalg.LinAlgError:
-                    return np.zeros_like(x)
-
-            # For a scalar uncertainty scale projecting to the null space twice is
-            # equivalent to projecting once
-            return lambda y: unc_scale * null_space_proj(y)
-
-        # Compute calibration term in the A view as a linear operator with scaling from
-        # degrees of freedom
-        calibration_term_A = linops.LinearOperator(
-            shape=(self.n, self.n),
-            dtype=S.dtype,
-            matmul=linops.LinearOperator.broadcast_matvec(
-                get_null_space_map(V=S, unc_scale=phi)
-            ),
-        )
-
-        # Compute calibration term in the Ainv view as a linear operator with scaling
-        # from degrees of freedom
-        calibration_term_Ainv = linops.LinearOperator(
-            shape=(self.n, self.n),
-            dtype=S.dtype,
-            matmul=linops.LinearOperator.broadcast_matvec(
-                get_null_space_map(V=Y, unc_scale=psi)
-            ),
-        )
+        # Compute calibration terms in the A and Ainv views as scaled projections to the
+        # null spaces of span(S) and span(Y) with scaling from degrees of freedom. For
+        # a scalar uncertainty scale projecting to the null space twice is equivalent to
+        # projecting once.
+        calibration_term_A = _NullSpaceProjection(V=self.S, scale=phi)
+        calibration_term_Ainv = _NullSpaceProjection(V=self.Y, scale=psi)
 
         return calibration_term_A, calibration_term_Ainv
 
-    def _get_output_randvars(self, Y_list, sy_list, phi=None, psi=None):
+    def _get_output_randvars(self, phi=None, psi=None, return_randvars=True):
         """Return output random variables x, A, Ainv from their means and
-        covariances."""
+        covariances.
 
-        if self.iter_ > 0:
-            # Observations and inner products in A-space between actions
-            Y = np.hstack(Y_list)
-            sy = np.vstack(sy_list).ravel()
+        The observations and their inner products are read from the buffers without
+        copying, see :attr:`Y` and :attr:`sy`. The trace of the solution covariance
+        is always updated, while the random variables are only created and returned
+        if ``return_randvars`` is ``True`` or a collection containing their names
+        ``"x"``, ``"A"`` and ``"Ainv"``. Otherwise ``None`` is returned for them.
+        """
 
+        if self.iter_ > 0:
             # Posterior covariance factors
             if self.is_calib_covclass and (not phi is None) and (not psi is None):
-                # Ensure prior covariance class only acts in span(S) like A
-                @linops.LinearOperator.broadcast_matvec
-                def _matmul(x):
-                    # First term of calibration covariance class: AS(S'AS)^{-1}S'A
-                    return (Y * sy ** -1) @ (Y.T @ x.ravel())
-
-                _A_covfactor0 = linops.LinearOperator(
-                    shape=(self.n, self.n),
-                    dtype=np.result_type(Y, sy),
-                    matmul=_matmul,
-                )
-
-                @linops.LinearOperator.broadcast_matvec
-                def _matmul(x):
-                    # Term in covariance class: A_0^{-1}Y(Y'A_0^{-1}Y)^{-1}Y'A_0^{-1}
-                    # TODO: for efficiency ensure that we dont have to compute
-                    # (Y.T Y)^{-1} two times! For a scalar mean this is the same as in
-                    # the null space projection
-                    YAinv0Y_inv_YAinv0x = np.linalg.solve(
-                        Y.T @ (self.Ainv_mean0 @ Y), Y.T @ (self.Ainv_mean0 @ x)
-                    )
-                    return self.Ainv_mean0 @ (Y @ YAinv0Y_inv_YAinv0x)
+                Y = self.Y
 
-                _Ainv_covfactor0 = linops.LinearOperator(
-                    shape=(self.n, self.n),
-                    dtype=np.result_type(Y, self.Ainv_mean0),
-                    matmul=_matmul,
+                # Ensure prior covariance class only acts in span(S) like A
+                # First term of calibration covariance class: AS(S'AS)^{-1}S'A
+                _A_covfactor0 = _SymmetricLowRank(U=Y, weights=self.sy ** -1)
+
+                # Term in covariance class: A_0^{-1}Y(Y'A_0^{-1}Y)^{-1}Y'A_0^{-1}
+                # = UU' with U = A_0^{-1}YL^{-T}, where Y'A_0^{-1}Y = LL' (A_0^{-1} is
+                # symmetric positive definite)
+                Ainv0Y = self.Ainv_mean0 @ Y
+                YAinv0Y_chol = scipy.linalg.cholesky(Y.T @ Ainv0Y, lower=True)
+                _Ainv_covfactor0 = _SymmetricLowRank(
+                    U=scipy.linalg.solve_triangular(
+                        YAinv0Y_chol, Ainv0Y.T, lower=True
+                    ).T
                 )
 
                 # Set degrees of freedom based on uncertainty calibration in unexplored
@@ -700,11 +1205,10 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
                 ) = self._get_calibration_covariance_update_terms(phi=phi, psi=psi)
 
                 _A_covfactor = (
-                    _A_covfactor0 - self._A_covfactor_update_term + calibration_term_A
+                    self._covfactor_update(_A_covfactor0, view="A") + calibration_term_A
                 )
                 _Ainv_covfactor = (
-                    _Ainv_covfactor0
-                    - self._Ainv_covfactor_update_term
+                    self._covfactor_update(_Ainv_covfactor0, view="Ainv")
                     + calibration_term_Ainv
                 )
             else:
@@ -716,66 +1220,282 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
             _A_covfactor = self.A_covfactor0
             _Ainv_covfactor = self.Ainv_covfactor0
 
-        # Create output random variables
-        A = randvars.Normal(
-            mean=self.A_mean, cov=linops.SymmetricKronecker(A=_A_covfactor)
-        )
-
-        Ainv = randvars.Normal(
-            mean=self.Ainv_mean,
-            cov=linops.SymmetricKronecker(A=_Ainv_covfactor),
-        )
         # Induced distribution on x via Ainv
         # Exp(x) = Ainv b, Cov(x) = 1/2 (W b'Wb + Wbb'W)
-        Wb = _Ainv_covfactor @ self.b
-        bWb = np.squeeze(Wb.T @ self.b)
+        b = np.ravel(self.b)
+        if _Ainv_covfactor is self.Ainv_covfactor:
+            k = self._num_updates
+            Wb = self._covfactor_matvec(
+                C=_Ainv_covfactor,
+                C0=self.Ainv_covfactor0,
+                U=self._U_Ainv[:, :k],
+                W=self._Wy[:, :k],
+                x=b,
+            )
+        else:
+            Wb = self._symmetric_matvec(self._unwrapped(_Ainv_covfactor), b)
+        bWb = (Wb @ b).item()
+        Wb = Wb[:, np.newaxis]
+
+        # Compute trace of solution covariance: tr(Cov(x)). Rounding errors (e.g. of
+        # lower precision covariance factors) or an indefinite prior can make it
+        # negative, in which case it is clamped at zero and not used as a stopping
+        # criterion
+        trace_sol_cov = np.real_if_close(
+            self._compute_trace_solution_covariance(bWb=bWb, Wb=Wb)
+        ).item()
+        self._trace_sol_cov_resolved = (
+            self.trace_Ainv_covfactor >= 0 and trace_sol_cov >= 0
+        )
+        self.trace_sol_cov = max(trace_sol_cov, 0.0)
+
+        if return_randvars is True:
+            return_randvars = ("x", "A", "Ainv")
+        elif not return_randvars:
+            return None, None, None
+
+        # Dense parameters are updated in-place by the solver, so the output random
+        # variables must hold a (symmetrized) copy
+        if isinstance(_A_covfactor, np.ndarray) and "A" in return_randvars:
+            _A_covfactor = self._symmetrized(_A_covfactor)
+        if isinstance(_Ainv_covfactor, np.ndarray) and (
+            "x" in return_randvars or "Ainv" in return_randvars
+        ):
+            _Ainv_covfactor = self._symmetrized(_Ainv_covfactor)
+
+        # Create output random variables
+        A = None
+        if "A" in return_randvars:
+            A = randvars.Normal(
+                mean=self._output_mean(self.A_mean, self.A_mean0),
+                cov=linops.SymmetricKronecker(A=_A_covfactor),
+            )
+
+        Ainv = None
+        if "Ainv" in return_randvars:
+            Ainv = randvars.Normal(
+                mean=self._output_mean(self.Ainv_mean, self.Ainv_mean0),
+                cov=linops.SymmetricKronecker(A=_Ainv_covfactor),
+            )
+
+        if "x" not in return_randvars:
+            return None, A, Ainv
 
         def _matmul(x):
-            return 0.5 * (bWb * _Ainv_covfactor @ x + Wb @ (Wb.T @ x))
+            return 0.5 * (bWb * (_Ainv_covfactor @ x) + Wb @ (Wb.T @ x))
+
+        def _rmatmul(x):
+            return 0.5 * (bWb * (x @ _Ainv_covfactor) + (x @ Wb) @ Wb.T)
+
+        # The trace is known in closed form, see `_compute_trace_solution_covariance`,
+        # unless the trace of the prior covariance factor was estimated or the result
+        # was clamped
+        cov_kwargs = {}
+        if self._Ainv_covfactor0_trace_exact and self._trace_sol_cov_resolved:
+            trace_sol_cov = self.trace_sol_cov
+            cov_kwargs["trace"] = lambda: trace_sol_cov
 
         cov_op = linops.LinearOperator(
             shape=(self.n, self.n),
-            dtype=np.result_type(Wb.dtype, bWb.dtype),
+            dtype=Wb.dtype,
             matmul=_matmul,
+            rmatmul=_rmatmul,
+            transpose=lambda: cov_op,
+            **cov_kwargs,
         )
 
-        x = randvars.Normal(mean=self.x_mean.ravel(), cov=cov_op)
-
-        # Compute trace of solution covariance: tr(Cov(x))
-        self.trace_sol_cov = np.real_if_close(
-            self._compute_trace_solution_covariance(bWb=bWb, Wb=Wb)
-        ).item()
+        x = randvars.Normal(mean=self.x_mean.ravel().copy(), cov=cov_op)
 
         return x, A, Ainv
 
-    def _mean_update(self, u, v):
-        """Linear operator implementing the symmetric rank 2 mean update (+= uv' +
-        vu')."""
+    @staticmethod
+    def _as_dense_buffer(M, dtype=None):
+        """Return a column-major copy of a dense parameter, which can be updated
+        in-place by BLAS routines, or ``M`` itself if it is not dense.
 
-        def _matmul(x):
-            return u @ (v.T @ x) + v @ (u.T @ x)
+        The buffer has the given floating point ``dtype`` or, by default, at least
+        double precision.
+        """
+        if isinstance(M, linops.Matrix) and isinstance(M.A, np.ndarray):
+            M = M.A
 
-        return linops.LinearOperator(
-            shape=(self.n, self.n),
-            dtype=np.result_type(u.dtype, v.dtype),
-            matmul=_matmul,
-        )
+        if isinstance(M, np.ndarray):
+            if dtype is None:
+                dtype = np.result_type(M.dtype, np.double)
+            return np.array(M, dtype=dtype, order="F")
 
-    def _covariance_update(self, u, Ws):
-        """Linear operator implementing the symmetric rank 2 kernels update (-= Ws
-        u^T)."""
+        return M
 
-        def _matmul(x):
-            return Ws @ (u.T @ x)
+    @classmethod
+    def _output_mean(cls, mean, mean0):
+        """(Symmetrized) copy of a dense mean for the output random variables, which is
+        a linear operator if the prior mean was one."""
+        if not isinstance(mean, np.ndarray):
+            return mean
 
-        return linops.LinearOperator(
-            shape=(self.n, self.n),
-            dtype=np.result_type(u.dtype, Ws.dtype),
-            matmul=_matmul,
+        if isinstance(mean0, linops.LinearOperator):
+            return linops.Matrix(cls._symmetrized(mean))
+
+        return cls._symmetrized(mean)
+
+    @staticmethod
+    def _symmetric_blas(M, x=None):
+        """Return whether the symmetric BLAS routines, which only access the lower
+        triangle, can be used to apply ``M`` to (and update it with) ``x`` in-place.
+
+        Single precision parameters are kept as full matrices instead, since the
+        ``ssymv`` kernels of some OpenBLAS versions return NaNs depending on the
+        preceding BLAS calls.
+        """
+        return (
+            isinstance(M, np.ndarray)
+            and M.dtype.char == "d"
+            and M.flags.f_contiguous
+            and (x is None or np.result_type(M.dtype, x.dtype) == M.dtype)
+        )
+
+    @staticmethod
+    def _lower_precision(M, x):
+        """Return whether ``M`` is a dense floating point parameter of lower precision
+        than ``x``."""
+        return (
+            isinstance(M, np.ndarray)
+            and M.dtype.char in "fd"
+            and M.dtype != x.dtype
+            and np.result_type(M.dtype, x.dtype) == x.dtype
         )
 
+    @classmethod
+    def _symmetric_matvec(cls, M, x):
+        """Product of a symmetric parameter with a vector of shape ``(n,)``.
+
+        For dense parameters only the lower triangle is read. Together with
+        :meth:`_symmetric_rank_2_update` and :meth:`_symmetric_rank_1_downdate` this
+        halves the memory traffic of the dense parameters.
+        """
+        if (
+            isinstance(M, np.ndarray)
+            and M.flags.c_contiguous
+            and not cls._symmetric_blas(M)
+        ):
+            # The transpose of a C-contiguous symmetric matrix is itself F-contiguous
+            M = M.T
+
+        if cls._lower_precision(M, x):
+            # Apply a lower precision parameter in its own precision
+            x = x.astype(M.dtype)
+
+        if cls._symmetric_blas(M, x):
+            symv = scipy.linalg.blas.get_blas_funcs("symv", (M,))
+            return symv(1.0, M, x, lower=1)
+
+        return M @ x
+
+    def _mean_and_covfactor_matvec(self, M, C, M0, C0, U, V, W, x):
+        """Products of a mean ``M`` and a covariance factor ``C`` with a vector of
+        shape ``(n,)``.
+
+        If neither is dense, they are the prior plus the low-rank updates
+        :math:`M = M_0 + UV^\\top + VU^\\top` and :math:`C = C_0 - WU^\\top` stored in
+        the buffers. Both products are then evaluated from the buffers, computing
+        :math:`U^\\top x` only once.
+        """
+        if isinstance(M, np.ndarray) or isinstance(C, np.ndarray):
+            return self._symmetric_matvec(M, x), self._symmetric_matvec(C, x)
+
+        Ux = U.T @ x
+        Mx = self._unwrapped(M0) @ x + U @ (V.T @ x) + V @ Ux
+        Cx = self._unwrapped(C0) @ x - W @ Ux
+        return Mx, Cx
+
+    def _mean_matvec(self, M, M0, U, V, x):
+        """Product of a mean ``M`` with a vector of shape ``(n,)``, which is evaluated
+        from the prior and the buffered updates :math:`M = M_0 + UV^\\top + VU^\\top`
+        if it is not dense."""
+        if isinstance(M, np.ndarray):
+            return self._symmetric_matvec(M, x)
+
+        return self._unwrapped(M0) @ x + U @ (V.T @ x) + V @ (U.T @ x)
+
+    def _covfactor_matvec(self, C, C0, U, W, x):
+        """Product of a covariance factor ``C`` with a vector of shape ``(n,)``, which
+        is evaluated from the prior and the buffered updates :math:`C = C_0 - WU^\\top`
+        if it is not dense."""
+        if isinstance(C, np.ndarray):
+            return self._symmetric_matvec(C, x)
+
+        return self._unwrapped(C0) @ x - W @ (U.T @ x)
+
+    @staticmethod
+    def _unwrapped(M):
+        """Return the sparse matrix held by a :class:`~probnum.linops.Matrix`, which is
+        applied directly instead of via the linear operator interface, or ``M``
+        itself."""
+        if isinstance(M, linops.Matrix) and scipy.sparse.issparse(M.A):
+            return M.A
+
+        return M
+
+    @staticmethod
+    def _symmetrized(M):
+        """Full copy of a dense symmetric parameter of which only the lower triangle
+        is up to date."""
+        return np.tril(M) + np.tril(M, -1).T
+
+    def _step_stagnated(self, step_size, search_dir):
+        """Return whether a step is below the floating point resolution of the solution
+        estimate, such that the corresponding belief updates are numerical noise."""
+        return abs(step_size) * np.linalg.norm(search_dir) <= self._step_tolerance()
+
+    def _step_tolerance(self):
+        """Floating point resolution of the solution estimate."""
+        return np.finfo(self.x_mean.dtype).eps * max(1.0, np.linalg.norm(self.x_mean))
+
+    def _symmetric_rank_2_update(self, M, M0, U, V):
+        """Symmetric rank 2 update (+= uv' + vu') of a mean with the most recent
+        columns ``u`` and ``v`` of ``U`` and ``V``.
+
+        Dense means are updated in-place. Linear operators are replaced by the prior
+        mean with a single low-rank update (+= UV' + VU') acting on all updates at
+        once, instead of growing a tree of rank 2 linear operators.
+        """
+        if not isinstance(M, np.ndarray):
+            return _LowRankUpdate(self._unwrapped(M0), U=U, V=V, symmetric=True)
+
+        u = U[:, -1]
+        v = V[:, -1]
+
+        if self._symmetric_blas(M, u) and self._symmetric_blas(M, v):
+            syr2 = scipy.linalg.blas.get_blas_funcs("syr2", (M,))
+            return syr2(1.0, u, v, lower=1, a=M, overwrite_a=True)
+
+        ger = scipy.linalg.blas.get_blas_funcs("ger", (M, u, v))
+        M = ger(1.0, u, v, a=M, overwrite_a=True)
+        return ger(1.0, v, u, a=M, overwrite_a=True)
+
+    def _symmetric_rank_1_downdate(self, M, w, scale):
+        """Symmetric rank 1 downdate (-= ww' / scale) of a dense covariance factor,
+        which is performed in-place."""
+        if self._lower_precision(M, w):
+            w = w.astype(M.dtype)
+
+        if self._symmetric_blas(M, w):
+            syr = scipy.linalg.blas.get_blas_funcs("syr", (M,))
+            return syr(-1.0 / scale, w.ravel(), lower=1, a=M, overwrite_a=True)
+
+        ger = scipy.linalg.blas.get_blas_funcs("ger", (M, w))
+        return ger(-1.0 / scale, w.ravel(), w.ravel(), a=M, overwrite_a=True)
+
     def solve(
-        self, callback=None, maxiter=None, atol=None, rtol=None, calibration=None
+        self,
+        callback=None,
+        maxiter=None,
+        atol=None,
+        rtol=None,
+        calibration=None,
+        jit=False,
+        trace_estimator=None,
+        covfactor_dtype=None,
     ):
         """Solve the linear system :math:`Ax=b`.
 
@@ -785,7 +1505,9 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
             User-supplied function called after each iteration of the linear solver. It
             is called as ``callback(xk, Ak, Ainvk, sk, yk, alphak, resid)`` and can be
             used to return quantities from the iteration. Note that depending on the
-            function supplied, this can slow down the solver.
+            function supplied, this can slow down the solver. Each of the posterior
+            beliefs ``xk``, ``Ak`` and ``Ainvk`` is only computed if it is an explicit
+            parameter of the callback, otherwise ``None`` is passed for it.
         maxiter : int
             Maximum number of iterations
         atol : float
@@ -805,6 +1527,25 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
              Running (weighted) mean              ``weightedmean``
              GP regression for kernel matrices    ``gpkern``
             ====================================  ================
+        jit : bool, default=False
+            If ``True`` and the system matrix, the prior means and the covariance
+            factors are all dense arrays, the numerical work of each iteration is
+            compiled with :mod:`numba`. Otherwise this option has no effect. Requires
+            the optional dependency :mod:`numba`.
+        trace_estimator : callable, optional
+            Function estimating the trace of the prior covariance factor of the inverse
+            :math:`A^{-1}` for the uncertainty-based stopping criteria, e.g.
+            ``functools.partial(probnum.utils.linalg.trace_hutchinson, rng=rng)``. By
+            default the trace is computed exactly, which requires :math:`n`
+            matrix-vector products if the covariance factor is a general linear
+            operator. The estimate is not used for the trace of the returned solution
+            covariance.
+        covfactor_dtype : numpy.dtype, optional
+            Floating point type in which dense covariance factors are stored and
+            applied, e.g. :class:`numpy.float32` to halve their memory traffic. The
+            means and the solution estimate are always kept in at least double
+            precision. Note that the covariance factors determine the directions of the
+            mean updates, so reducing their precision can slow down convergence.
 
         Returns
         -------
@@ -820,7 +1561,52 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
         """  # pylint: disable=line-too-long
         # Initialization
         self.iter_ = 0
-        resid = self.A @ self.x_mean - self.b
+        if maxiter is None:
+            maxiter = self.n * 10
+        A_op = self._unwrapped(self.A)
+        resid = A_op @ self.x_mean - self.b
+
+        # The solution estimate and the residual are updated in-place
+        dtype = np.result_type(self.x_mean.dtype, resid.dtype, np.double)
+        self.x_mean = np.array(self.x_mean, dtype=dtype)
+        resid = np.array(resid, dtype=dtype).reshape(-1)
+        axpy = scipy.linalg.blas.get_blas_funcs("axpy", (self.x_mean,))
+
+        # Dense means and covariance factors are updated in-place. Since they are
+        # symmetric, only their lower triangles are read and updated by the BLAS
+        # routines, see `_symmetric_matvec`
+        self.A_mean = self._as_dense_buffer(self.A_mean)
+        self.Ainv_mean = self._as_dense_buffer(self.Ainv_mean)
+        self.A_covfactor = self._as_dense_buffer(
+            self.A_covfactor, dtype=covfactor_dtype
+        )
+        self.Ainv_covfactor = self._as_dense_buffer(
+            self.Ainv_covfactor, dtype=covfactor_dtype
+        )
+
+        # JIT-compiled iteration for dense parameters
+        dense_step = None
+        if jit:
+            _dense_step = _jit_dense_iteration_step()
+
+            if isinstance(self.A, np.ndarray) and all(
+                isinstance(M, np.ndarray) and M.dtype == np.double
+                for M in (
+                    self.A_mean,
+                    self.Ainv_mean,
+                    self.A_covfactor,
+                    self.Ainv_covfactor,
+                )
+            ):
+                dense_step = _dense_step
+                A_dense = np.asarray(self.A, dtype=np.double)
+
+        # The products with the beliefs about the matrix and its inverse in each
+        # iteration are independent. For large systems they can be evaluated
+        # concurrently, since NumPy releases the GIL during BLAS calls.
+        matvec_pool = None
+        if self._parallel_matvecs and self.n >= self._min_parallel_matvec_dim:
+            matvec_pool = _matvec_thread_pool()
 
         # Initialize uncertainty calibration
         phi = None
@@ -844,15 +1630,33 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
                 phi = calibration
                 psi = 1 / calibration
 
-        # Trace of solution covariance
+        # Trace of solution covariance (the trace of the prior covariance factor is
+        # computed only once)
+        self._Ainv_covfactor0_trace_exact = trace_estimator is None
+        if trace_estimator is None:
+            self._Ainv_covfactor0_trace = self.Ainv_covfactor0.trace()
+        else:
+            self._Ainv_covfactor0_trace = trace_estimator(self.Ainv_covfactor0)
         _trace_Ainv_covfactor_update = 0
         self.trace_Ainv_covfactor = self._compute_trace_Ainv_covfactor0(
             Y=None, unc_scale=psi
         )
 
-        # Create output random variables
+        # Buffers for search directions and observations
+        self._init_observation_buffers(maxiter=maxiter)
+
+        # Only create the output random variables in each iteration which the callback
+        # uses
+        callback_randvars = ()
+        if callback is not None:
+            callback_params = inspect.signature(callback).parameters
+            callback_randvars = tuple(
+                name
+                for name, param in (("x", "xk"), ("A", "Ak"), ("Ainv", "Ainvk"))
+                if param in callback_params
+            )
         x, A, Ainv = self._get_output_randvars(
-            Y_list=self.obs_list, sy_list=self.sy, phi=phi, psi=psi
+            phi=phi, psi=psi, return_randvars=callback_randvars
         )
 
         # Iteration with stopping criteria
@@ -864,83 +1668,179 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
             if _has_converged:
                 break
 
-            # Compute search direction (with implicit reorthogonalization) via policy
-            search_dir = -self.Ainv_mean @ resid
-            self.search_dir_list.append(search_dir)
-
-            # Perform action and observe
-            obs = self.A @ search_dir
-            self.obs_list.append(obs)
-
-            # Compute step size
-            sy = search_dir.T @ obs
-            step_size = -np.squeeze((search_dir.T @ resid) / sy)
-            self.sy.append(sy)
-
-            # Step and residual update
-            self.x_mean = self.x_mean + step_size * search_dir
-            resid = resid + step_size * obs
-
-            # (Symmetric) mean and covariance updates
-            Vs = self.A_covfactor @ search_dir
-            delta_A = obs - self.A_mean @ search_dir
-            u_A = Vs / (search_dir.T @ Vs)
-            v_A = delta_A - 0.5 * (search_dir.T @ delta_A) * u_A
-
-            Wy = self.Ainv_covfactor @ obs
-            delta_Ainv = search_dir - self.Ainv_mean @ obs
-            yWy = np.squeeze(obs.T @ Wy)
-            u_Ainv = Wy / yWy
-            v_Ainv = delta_Ainv - 0.5 * (obs.T @ delta_Ainv) * u_Ainv
-
-            # Rank 2 mean updates (+= uv' + vu')
-            self.A_mean = linops.aslinop(self.A_mean) + self._mean_update(u=u_A, v=v_A)
-            self.Ainv_mean = linops.aslinop(self.Ainv_mean) + self._mean_update(
-                u=u_Ainv, v=v_Ainv
-            )
+            if dense_step is not None:
+                # Compiled iteration, which also updates the means, covariance
+                # factors, solution estimate and residual in-place and writes the
+                # observation and update vectors directly into the buffers
+                self._reserve_buffer_columns()
+                k = self._num_obs
+                step_size, sy, yWy, updated = dense_step(
+                    A_dense,
+                    self.A_mean,
+                    self.Ainv_mean,
+                    self.A_covfactor,
+                    self.Ainv_covfactor,
+                    self.x_mean.reshape(-1),
+                    resid,
+                    self._S,
+                    self._Y,
+                    self._sy,
+                    self._ss,
+                    self._U_A,
+                    self._V_A,
+                    self._Vs,
+                    self._U_Ainv,
+                    self._V_Ainv,
+                    self._Wy,
+                    k,
+                    self._step_tolerance(),
+                )
+
+                # The compiled iteration checks for zero curvature and stagnation
+                # before updating
+                if not updated:
+                    _conv_crit = "zero_curvature" if sy == 0.0 else "step_stagnation"
+                    break
+
+                self._num_obs += 1
+                self._num_updates += 1
+
+                search_dir = self._S[:, k].copy()
+                obs = self._Y[:, k].copy()
+                Wy = self._Wy[:, k]
+            else:
+                # Compute search direction (with implicit reorthogonalization) via
+                # policy
+                k = self._num_updates
+                search_dir = -self._mean_matvec(
+                    M=self.Ainv_mean,
+                    M0=self.Ainv_mean0,
+                    U=self._U_Ainv[:, :k],
+                    V=self._V_Ainv[:, :k],
+                    x=resid,
+                )
+
+                # Perform action and observe (the symmetry of the system matrix is
+                # not assumed here, such that the residual stays exact)
+                obs = A_op @ search_dir
+
+                # Compute step size (as Python scalars, such that the vector updates
+                # below are scaled without NumPy scalar dispatch)
+                sy = (search_dir @ obs).item()
+
+                # Stop if the search direction has no curvature (e.g. if it is zero),
+                # since the step size is undefined
+                if sy == 0.0:
+                    _conv_crit = "zero_curvature"
+                    break
+
+                step_size = -(search_dir @ resid).item() / sy
+
+                # Stop before updating the beliefs with a step which no longer changes
+                # the solution estimate
+                if self._step_stagnated(step_size, search_dir):
+                    _conv_crit = "step_stagnation"
+                    break
+
+                self._store_observation(search_dir, obs, sy)
+
+                # Step and residual update (x += alpha * s, r += alpha * y)
+                axpy(search_dir, self.x_mean.reshape(-1), a=step_size)
+                axpy(obs, resid, a=step_size)
+
+                # (Symmetric) mean and covariance updates
+                Ainv_matvec = functools.partial(
+                    self._mean_and_covfactor_matvec,
+                    M=self.Ainv_mean,
+                    C=self.Ainv_covfactor,
+                    M0=self.Ainv_mean0,
+                    C0=self.Ainv_covfactor0,
+                    U=self._U_Ainv[:, :k],
+                    V=self._V_Ainv[:, :k],
+                    W=self._Wy[:, :k],
+                    x=obs,
+                )
+                if matvec_pool is not None:
+                    Ainv_matvec = matvec_pool.submit(Ainv_matvec).result
+
+                A_mean_s, Vs = self._mean_and_covfactor_matvec(
+                    M=self.A_mean,
+                    C=self.A_covfactor,
+                    M0=self.A_mean0,
+                    C0=self.A_covfactor0,
+                    U=self._U_A[:, :k],
+                    V=self._V_A[:, :k],
+                    W=self._Vs[:, :k],
+                    x=search_dir,
+                )
+                delta_A = obs - A_mean_s
+                sVs = (search_dir @ Vs).item()
+                u_A = Vs / sVs
+                v_A = delta_A - 0.5 * (search_dir @ delta_A).item() * u_A
+
+                Ainv_mean_y, Wy = Ainv_matvec()
+                delta_Ainv = search_dir - Ainv_mean_y
+                yWy = (obs @ Wy).item()
+                u_Ainv = Wy / yWy
+                v_Ainv = delta_Ainv - 0.5 * (obs @ delta_Ainv).item() * u_Ainv
+
+                self._store_update(u_A, v_A, Vs, u_Ainv, v_Ainv, Wy)
+                k = self._num_updates
+
+                # Rank 2 mean updates (+= uv' + vu')
+                self.A_mean = self._symmetric_rank_2_update(
+                    self.A_mean, self.A_mean0, U=self._U_A[:, :k], V=self._V_A[:, :k]
+                )
+                self.Ainv_mean = self._symmetric_rank_2_update(
+                    self.Ainv_mean,
+                    self.Ainv_mean0,
+                    U=self._U_Ainv[:, :k],
+                    V=self._V_Ainv[:, :k],
+                )
 
-            # Rank 1 covariance Kronecker factor update (-= u_A(Vs)' and -= u_Ainv(Wy)')
-            if self.iter_ == 0:
-                self._A_covfactor_update_term = self._covariance_update(u=u_A, Ws=Vs)
-                self._Ainv_covfactor_update_term = self._covariance_update(
-                    u=u_Ainv, Ws=Wy
+            # Rank 1 covariance Kronecker factor update (-= u_A(Vs)' and -= u_Ainv(Wy)'),
+            # applied to the prior as a single low-rank update of all iterations. The
+            # update operators are only created if a parameter is not dense
+            if dense_step is not None:
+                pass  # Already updated by the compiled iteration
+            elif isinstance(self.A_covfactor, np.ndarray):
+                # u_A(Vs)' = (Vs)(Vs)' / s'Vs
+                self.A_covfactor = self._symmetric_rank_1_downdate(
+                    self.A_covfactor, w=Vs, scale=sVs
                 )
             else:
-                self._A_covfactor_update_term = (
-                    self._A_covfactor_update_term
-                    + self._covariance_update(u=u_A, Ws=Vs)
+                self.A_covfactor = self._covfactor_update(self.A_covfactor0, view="A")
+            if dense_step is not None:
+                pass
+            elif isinstance(self.Ainv_covfactor, np.ndarray):
+                # u_Ainv(Wy)' = (Wy)(Wy)' / y'Wy
+                self.Ainv_covfactor = self._symmetric_rank_1_downdate(
+                    self.Ainv_covfactor, w=Wy, scale=yWy
                 )
-                self._Ainv_covfactor_update_term = (
-                    self._Ainv_covfactor_update_term
-                    + self._covariance_update(u=u_Ainv, Ws=Wy)
+            else:
+                self.Ainv_covfactor = self._covfactor_update(
+                    self.Ainv_covfactor0, view="Ainv"
                 )
-            self.A_covfactor = (
-                linops.aslinop(self.A_covfactor0) - self._A_covfactor_update_term
-            )
-            self.Ainv_covfactor = (
-                linops.aslinop(self.Ainv_covfactor0) - self._Ainv_covfactor_update_term
-            )
 
             # Calibrate uncertainty based on Rayleigh quotient
             if isinstance(calibration, str) and self.is_calib_covclass:
                 phi, psi = self._calibrate_uncertainty(
-                    S=np.hstack(self.search_dir_list),
-                    sy=np.vstack(self.sy).ravel(),
-                    method=calibration,
+                    ss=self.ss, sy=self.sy, method=calibration
                 )
 
             # Update trace of solution covariance: tr(Cov(Hb))
-            _trace_Ainv_covfactor_update += 1 / yWy * np.squeeze(Wy.T @ Wy)
+            # The updates cancel with the prior trace, so they are accumulated in
+            # double precision
+            Wy = Wy.astype(np.double, copy=False)
+            _trace_Ainv_covfactor_update += (Wy @ Wy) / yWy
             self.trace_Ainv_covfactor = np.real_if_close(
-                self._compute_trace_Ainv_covfactor0(
-                    Y=np.hstack(self.obs_list), unc_scale=psi
-                )
+                self._compute_trace_Ainv_covfactor0(Y=self.Y, unc_scale=psi)
                 - _trace_Ainv_covfactor_update
             ).item()
 
             # Create output random variables
             x, A, Ainv = self._get_output_randvars(
-                Y_list=self.obs_list, sy_list=self.sy, phi=phi, psi=psi
+                phi=phi, psi=psi, return_randvars=callback_randvars
             )
 
             # Callback function used to extract quantities from iteration
@@ -949,15 +1849,19 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
                     xk=x,
                     Ak=A,
                     Ainvk=Ainv,
-                    sk=search_dir,
-                    yk=obs,
+                    sk=search_dir[:, np.newaxis],
+                    yk=obs[:, np.newaxis],
                     alphak=step_size,
-                    resid=resid,
+                    resid=resid[:, np.newaxis].copy(),
                 )
 
             # Iteration increment
             self.iter_ += 1
 
+        # Create output random variables
+        if x is None or A is None or Ainv is None:
+            x, A, Ainv = self._get_output_randvars(phi=phi, psi=psi)
+
         # Log information on solution
         info = {
             "iter": self.iter_,
@@ -30,6 +30,7 @@ from ._linear_operator import (
 from ._scaling import Scaling, Zero
 
 _AnyLinOp = [
+    LinearOperator,
     NegatedLinearOperator,
     ProductLinearOperator,
     ScaledLinearOperator,
@@ -68,6 +69,13 @@ def sub(op1: BinaryOperandType, op2: BinaryOperandType) -> LinearOperator:
 
 
 def mul(op1: BinaryOperandType, op2: BinaryOperandType) -> LinearOperator:
+    # Scaling by zero annihilates any linear operator
+    if np.ndim(op1) == 0 and isinstance(op2, LinearOperator) and op1 == 0:
+        return Zero(op2.shape, dtype=np.result_type(op2.dtype, op1))
+
+    if np.ndim(op2) == 0 and isinstance(op1, LinearOperator) and op2 == 0:
+        return Zero(op1.shape, dtype=np.result_type(op1.dtype, op2))
+
     return _apply(_mul_fns, op1, op2, fallback_operator=_mul_fallback)
 
 
@@ -117,6 +125,24 @@ _mul_fns[(Scaling, Scaling)] = Scaling._mul_scaling
 _matmul_fns[(Scaling, Scaling)] = Scaling._matmul_scaling
 
 # ScaledLinearOperator
+def _mul_scalar_scaled(
+    scalar: ScalarArgType, scaled: ScaledLinearOperator
+) -> ScaledLinearOperator:
+    return ScaledLinearOperator(scaled._linop, scalar * scaled._scalar)
+
+
+def _mul_scaled_scalar(
+    scaled: ScaledLinearOperator, scalar: ScalarArgType
+) -> ScaledLinearOperator:
+    return ScaledLinearOperator(scaled._linop, scaled._scalar * scalar)
+
+
+_mul_fns[(np.number, ScaledLinearOperator)] = _mul_scalar_scaled
+_mul_fns[(ScaledLinearOperator, np.number)] = _mul_scaled_scalar
+_mul_fns[(np.number, NegatedLinearOperator)] = _mul_scalar_scaled
+_mul_fns[(NegatedLinearOperator, np.number)] = _mul_scaled_scalar
+
+
 def _matmul_scaled_op(scaled, anylinop):
     return scaled._scalar * (scaled._linop @ anylinop)
 
@@ -306,10 +332,21 @@ def _matmul_any_id(anyop: LinearOperator, idty: Identity) -> LinearOperator:
     return anyop
 
 
+def _mul_scalar_id(scalar: ScalarArgType, idty: Identity) -> Scaling:
+    return Scaling(scalar, shape=idty.shape, dtype=np.result_type(idty.dtype, scalar))
+
+
+def _mul_id_scalar(idty: Identity, scalar: ScalarArgType) -> Scaling:
+    return Scaling(scalar, shape=idty.shape, dtype=np.result_type(idty.dtype, scalar))
+
+
 for op_type in _AnyLinOp:
     _matmul_fns[(Identity, op_type)] = _matmul_id_any
     _matmul_fns[(op_type, Identity)] = _matmul_any_id
 
+_mul_fns[(np.number, Identity)] = _mul_scalar_id
+_mul_fns[(Identity, np.number)] = _mul_id_scalar
+
 
 # Selection / Embedding
 def _matmul_selection_embedding(
@@ -370,6 +407,17 @@ def _sub_anylinop_zero(op: LinearOperator, z: Zero) -> Zero:
     return op
 
 
+def _mul_scalar_zero(scalar: ScalarArgType, z: Zero) -> Zero:
+    return Zero(z.shape, dtype=np.result_type(z.dtype, scalar))
+
+
+def _mul_zero_scalar(z: Zero, scalar: ScalarArgType) -> Zero:
+    return Zero(z.shape, dtype=np.result_type(z.dtype, scalar))
+
+
+_mul_fns[(np.number, Zero)] = _mul_scalar_zero
+_mul_fns[(Zero, np.number)] = _mul_zero_scalar
+
 for op_type in _AnyLinOp:
     _matmul_fns[(Zero, op_type)] = _matmul_zero_anylinop
     _matmul_fns[(op_type, Zero)] = _matmul_anylinop_zero
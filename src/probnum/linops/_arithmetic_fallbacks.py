@@ -1,14 +1,16 @@
 """Fallback-implementations of LinearOperator arithmetic."""
 import functools
 import operator
-from typing import Tuple, Union
+import threading
+import weakref
+from typing import Dict, Iterator, Tuple, Union
 
 import numpy as np
 
 import probnum.utils
 from probnum.typing import NotImplementedType, ScalarArgType
 
-from ._linear_operator import BinaryOperandType, LinearOperator
+from ._linear_operator import BinaryOperandType, LinearOperator, Matrix
 
 ########################################################################################
 # Generic Linear Operator Arithmetic (Fallbacks)
@@ -47,6 +49,9 @@ class ScaledLinearOperator(LinearOperator):
 
         return ScaledLinearOperator(self._linop.inv(), 1.0 / self._scalar)
 
+    def __neg__(self) -> "ScaledLinearOperator":
+        return ScaledLinearOperator(self._linop, -self._scalar)
+
     def __repr__(self) -> str:
         return f"{self._scalar} * {self._linop}"
 
@@ -77,11 +82,11 @@ class SumLinearOperator(LinearOperator):
             dtype=np.find_common_type(
                 [summand.dtype for summand in self._summands], []
             ),
-            matmul=lambda x: functools.reduce(
-                operator.add, (summand @ x for summand in self._summands)
+            matmul=lambda x: self._accumulate(
+                (summand @ x for summand in self._summands), x
             ),
-            rmatmul=lambda x: functools.reduce(
-                operator.add, (x @ summand for summand in self._summands)
+            rmatmul=lambda x: self._accumulate(
+                (x @ summand for summand in self._summands), x
             ),
             todense=lambda: functools.reduce(
                 operator.add,
@@ -104,6 +109,20 @@ class SumLinearOperator(LinearOperator):
             res += f"\t{s}, \n"
         return res + "]"
 
+    def _accumulate(self, terms: Iterator[np.ndarray], x: np.ndarray) -> np.ndarray:
+        """Sum up the results of all summands in a single buffer."""
+        res = next(terms).astype(np.result_type(self.dtype, x.dtype), copy=False)
+
+        # Summands may return the operand as is (e.g. `Identity`), which must not be
+        # modified in-place
+        if np.may_share_memory(res, x):
+            res = res.copy()
+
+        for term in terms:
+            res += term
+
+        return res
+
     @staticmethod
     def _expand_sum_ops(*summands: LinearOperator) -> Tuple[LinearOperator, ...]:
         expanded_summands = []
@@ -131,6 +150,13 @@ def _mul_fallback(
     return res
 
 
+# Persistent buffers for intermediate results of `ProductLinearOperator`s, indexed by
+# operator and factor. They are local to each thread, such that an operator can be
+# applied concurrently. They are not attributes of the operators, which can thus still
+# be copied, and they are released together with the operators.
+_product_buffers = threading.local()
+
+
 class ProductLinearOperator(LinearOperator):
     """(Operator) Product of two linear operators."""
 
@@ -150,9 +176,7 @@ class ProductLinearOperator(LinearOperator):
         super().__init__(
             shape=(self._factors[0].shape[0], self._factors[-1].shape[1]),
             dtype=np.find_common_type([factor.dtype for factor in self._factors], []),
-            matmul=lambda x: functools.reduce(
-                lambda vec, op: op @ vec, reversed(self._factors), x
-            ),
+            matmul=self._matmul,
             rmatmul=lambda x: functools.reduce(
                 lambda vec, op: vec @ op, self._factors, x
             ),
@@ -174,6 +198,54 @@ class ProductLinearOperator(LinearOperator):
             ),
         )
 
+    def _matmul(self, x: np.ndarray) -> np.ndarray:
+        vec = x
+
+        for i in range(len(self._factors) - 1, -1, -1):
+            factor = self._factors[i]
+
+            # Intermediate products with dense matrices are written into persistent
+            # buffers to avoid allocating a temporary per factor and application
+            if (
+                i > 0
+                and isinstance(factor, Matrix)
+                and isinstance(factor.A, np.ndarray)
+            ):
+                out = self._buffer(
+                    i,
+                    vec.shape[:-2] + (factor.shape[0], vec.shape[-1]),
+                    np.result_type(factor.dtype, vec.dtype),
+                )
+
+                vec = np.matmul(factor.A, vec, out=out)
+            else:
+                vec = factor @ vec
+
+        # The result must never alias one of the buffers (e.g. if the leftmost factor
+        # returns its operand as is)
+        if any(np.may_share_memory(vec, buf) for buf in self._buffers().values()):
+            vec = vec.copy()
+
+        return vec
+
+    def _buffers(self) -> Dict[int, np.ndarray]:
+        buffers = getattr(_product_buffers, "buffers", None)
+
+        if buffers is None:
+            buffers = _product_buffers.buffers = weakref.WeakKeyDictionary()
+
+        return buffers.setdefault(self, {})
+
+    def _buffer(self, idx: int, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        buffers = self._buffers()
+        buf = buffers.get(idx)
+
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            buffers[idx] = buf
+
+        return buf
+
     @staticmethod
     def _expand_prod_ops(*factors: LinearOperator) -> Tuple[LinearOperator, ...]:
         expanded_factors = []
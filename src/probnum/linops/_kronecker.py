@@ -449,8 +449,9 @@ class SymmetricKronecker(_linear_operator.LinearOperator):
 class IdentityKronecker(_linear_operator.LinearOperator):
     def __init__(self, num_blocks: int, B: _utils.LinearOperatorLike):
         self._num_blocks = num_blocks
-        self.A = _linear_operator.Identity(num_blocks)
         self.B = _utils.aslinop(B)
+        # Match the dtype of `B`, such that the identity factor does not promote it
+        self.A = _linear_operator.Identity(num_blocks, dtype=self.B.dtype)
 
         if self.B.is_square:
             # det(A (x) B) = det(A)^n * det(B)^m
@@ -1,5 +1,6 @@
 """Finite-dimensional linear operators."""
 
+import functools
 from typing import Callable, Optional, Tuple, Union
 
 import numpy as np
@@ -17,6 +18,30 @@ BinaryOperandType = Union[
 # pylint: disable="too-many-lines"
 
 
+# Maximum dimension of the shared identity matrices
+_MAX_SHARED_EYE_DIM = 256
+
+
+def _eye(n: int, dtype: np.dtype) -> np.ndarray:
+    """Read-only identity matrix, which is shared between calls with the same
+    arguments if it is small."""
+    if n <= _MAX_SHARED_EYE_DIM:
+        return _shared_eye(n, np.dtype(dtype))
+
+    eye = np.eye(n, dtype=dtype, order="F")
+    eye.setflags(write=False)
+
+    return eye
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_eye(n: int, dtype: np.dtype) -> np.ndarray:
+    eye = np.eye(n, dtype=dtype, order="F")
+    eye.setflags(write=False)
+
+    return eye
+
+
 class LinearOperator:
     r"""Composite base class for finite-dimensional linear operators.
 
@@ -99,6 +124,34 @@ class LinearOperator:
 
     # pylint: disable=too-many-public-methods
 
+    # Slot descriptors make attribute access on the hot paths (e.g. `__matmul__`)
+    # cheaper and shrink instances of the base class
+    __slots__ = (
+        "__shape",
+        "__dtype",
+        "__matmul",
+        "__rmatmul",
+        "__apply",
+        "__todense",
+        "__transpose",
+        "__inverse",
+        "__rank",
+        "__eigvals",
+        "__cond",
+        "__det",
+        "__logabsdet",
+        "__trace",
+        "__todense_cache",
+        "__rmatmul_transpose_cache",
+        "__rank_cache",
+        "__eigvals_cache",
+        "__cond_cache",
+        "__det_cache",
+        "__logabsdet_cache",
+        "__trace_cache",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         shape: ShapeArgType,
@@ -149,6 +202,7 @@ class LinearOperator:
 
         # Caches
         self.__todense_cache = None
+        self.__rmatmul_transpose_cache = None
 
         self.__rank_cache = None
         self.__eigvals_cache = None
@@ -215,7 +269,11 @@ class LinearOperator:
                 )
 
             if axis == (x.ndim - 1):
-                return (self @ x[..., np.newaxis])[..., 0]
+                # Batch all vectors into the columns of a single matrix, such that
+                # `matmul` is called once instead of once per vector
+                y = self @ x.reshape(-1, x.shape[-1]).T
+
+                return y.T.reshape(x.shape[:-1] + (self.__shape[0],))
             elif axis == (x.ndim - 2):
                 return self @ x
             else:
@@ -287,6 +345,8 @@ class LinearOperator:
             if self.__todense is not None:
                 dense = self.__todense()
             else:
+                # A new identity matrix, since user-defined products may work
+                # in-place on their operands
                 dense = self @ np.eye(self.shape[1], dtype=self.__dtype, order="F")
 
             if not cache:
@@ -296,6 +356,75 @@ class LinearOperator:
 
         return self.__todense_cache
 
+    def specialize(self) -> "LinearOperator":
+        """Linear operator with a matrix-vector product compiled for this operator.
+
+        Generates a :mod:`numba`-compiled matrix-vector product, in which the shape and
+        the (non-zero) entries of the dense matrix representation of the linear
+        operator are fixed at compile time. This removes the overhead of calling into
+        :mod:`numpy`, which dominates the cost of products with very small linear
+        operators. Since the code size grows with the number of non-zero entries, this
+        should only be used for small operators. Requires the optional dependency
+        :mod:`numba`.
+
+        Returns
+        -------
+        specialized :
+            Linear operator equivalent to this linear operator.
+        """
+        try:
+            import numba  # pylint: disable=import-outside-toplevel
+        except ImportError as err:
+            raise ImportError(
+                "Cannot specialize linear operators without optional dependency "
+                "numba. Try installing numba via `pip install numba`."
+            ) from err
+
+        dense = self.todense(cache=False)
+
+        # Unrolled products with the non-zero entries of each row. Non-finite entries
+        # have no literal representation and are read from the (constant) dense matrix
+        # instead.
+        rows = []
+
+        for i in range(self.__shape[0]):
+            terms = [
+                (
+                    f"{dense[i, j].item()!r}"
+                    if np.isfinite(dense[i, j])
+                    else f"_dense[{i}, {j}]"
+                )
+                + f" * x[{j}, k]"
+                for j in range(self.__shape[1])
+                if dense[i, j] != 0
+            ]
+
+            rows.append(f"        y[{i}, k] = {' + '.join(terms) if terms else '0'}\n")
+
+        source = (
+            "def _matmat(x, y):\n"
+            "    for k in range(x.shape[1]):\n" + "".join(rows) + "    return y\n"
+        )
+
+        namespace = {"_dense": dense}
+        exec(source, namespace)  # pylint: disable=exec-used
+        matmat = numba.njit(namespace["_matmat"])
+
+        def _matmul(x: np.ndarray) -> np.ndarray:
+            y = np.empty(
+                (self.__shape[0], x.shape[1]), dtype=np.result_type(self.dtype, x.dtype)
+            )
+
+            return matmat(x.astype(y.dtype, copy=False), y)
+
+        return LinearOperator(
+            self.__shape,
+            self.__dtype,
+            matmul=LinearOperator.broadcast_matmat(_matmul),
+            rmatmul=lambda x: x @ dense,
+            todense=lambda: dense,
+        )
+
     ####################################################################################
     # Derived Quantities
     ####################################################################################
@@ -508,7 +637,10 @@ class LinearOperator:
         if self.__rmatmul is not None:
             return TransposedLinearOperator(
                 self,
-                matmul=lambda x: self.__rmatmul(x[..., np.newaxis])[..., :],
+                # A^T X = (X^T A)^T, evaluated in a single call to `rmatmul`
+                matmul=lambda x: np.swapaxes(
+                    self.__rmatmul(np.swapaxes(x, -1, -2)), -1, -2
+                ),
             )
 
         return TransposedLinearOperator(self)
@@ -553,11 +685,19 @@ class LinearOperator:
         return sub(other, self)
 
     def __mul__(self, other: BinaryOperandType) -> "LinearOperator":
+        # Elementwise products with arrays are undefined, so there is no need to
+        # consult the operator registry
+        if isinstance(other, np.ndarray) and other.ndim > 0:
+            return NotImplemented
+
         from ._arithmetic import mul  # pylint: disable=import-outside-toplevel
 
         return mul(self, other)
 
     def __rmul__(self, other: BinaryOperandType) -> "LinearOperator":
+        if isinstance(other, np.ndarray) and other.ndim > 0:
+            return NotImplemented
+
         from ._arithmetic import mul  # pylint: disable=import-outside-toplevel
 
         return mul(other, self)
@@ -634,7 +774,11 @@ class LinearOperator:
                     else:
                         y = self.__rmatmul(x)
                 else:
-                    y = (self.T)(x, axis=-1)
+                    # Resolve the transpose only once instead of on every product
+                    if self.__rmatmul_transpose_cache is None:
+                        self.__rmatmul_transpose_cache = self.T
+
+                    y = self.__rmatmul_transpose_cache(x, axis=-1)
             else:
                 raise ValueError(
                     f"Dimension mismatch. Expected operand of shape (..., {M}), but "
@@ -670,10 +814,60 @@ class LinearOperator:
             if x.ndim == 2 and x.shape[1] == 1:
                 return matvec(x[:, 0])[:, np.newaxis]
 
-            return np.apply_along_axis(matvec, -2, x)
+            if x.ndim == 2:
+                return _apply_matvec_to_columns(matvec, x)
+
+            return _apply_to_matrix_stack(
+                lambda mat: _apply_matvec_to_columns(matvec, mat), x
+            )
 
         return _matmul
 
+    @classmethod
+    def broadcast_jit_matvec(
+        cls,
+        matvec: Callable[[np.ndarray], np.ndarray],
+        shape: ShapeArgType,
+        dtype: DTypeArgType,
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        """Broadcasting for a JIT-compiled matrix-vector product.
+
+        Like :meth:`broadcast_matvec`, but the loop over the columns of the operand is
+        compiled with :mod:`numba` and executed in parallel. The matrix-vector product
+        ``matvec`` must itself be compiled via :func:`numba.njit`. The ``shape`` and
+        ``dtype`` of the linear operator determine the shape and data type of the
+        result. Requires the optional dependency :mod:`numba`.
+        """
+        try:
+            import numba  # pylint: disable=import-outside-toplevel
+        except ImportError as err:
+            raise ImportError(
+                "Cannot JIT-compile matrix-vector products without optional "
+                "dependency numba. Try installing numba via `pip install numba`."
+            ) from err
+
+        @numba.njit(parallel=True)
+        def _fill_rows(xT: np.ndarray, yT: np.ndarray) -> None:
+            for j in numba.prange(xT.shape[0]):  # pylint: disable=not-an-iterable
+                yT[j] = matvec(xT[j])
+
+        num_rows = probnum.utils.as_shape(shape, ndim=2)[0]
+        dtype = np.dtype(dtype)
+
+        def _matmat(x: np.ndarray) -> np.ndarray:
+            # The rows of the transposes are the (contiguous) columns of the operands
+            xT = np.ascontiguousarray(x.T)
+
+            # Result buffer
+            yT = np.empty((x.shape[1], num_rows), dtype=np.result_type(dtype, x.dtype))
+
+            if x.shape[1] > 0:
+                _fill_rows(xT, yT)
+
+            return yT.T
+
+        return cls.broadcast_matmat(_matmat)
+
     @classmethod
     def broadcast_matmat(
         cls, matmat: Callable[[np.ndarray], np.ndarray]
@@ -702,7 +896,12 @@ class LinearOperator:
             if x.ndim == 2 and x.shape[0] == 1:
                 return rmatvec(x[0, :])[np.newaxis, :]
 
-            return np.apply_along_axis(rmatvec, -1, x)
+            if x.ndim == 2:
+                return _apply_rmatvec_to_rows(rmatvec, x)
+
+            return _apply_to_matrix_stack(
+                lambda mat: _apply_rmatvec_to_rows(rmatvec, mat), x
+            )
 
         return _rmatmul
 
@@ -747,6 +946,48 @@ def _apply_to_matrix_stack(
     return y
 
 
+def _apply_matvec_to_columns(
+    matvec: Callable[[np.ndarray], np.ndarray], x: np.ndarray
+) -> np.ndarray:
+    # Column-major copy of the operand (if necessary), such that all columns passed to
+    # `matvec` are contiguous
+    x = np.asfortranarray(x)
+
+    # Shape and dtype inference
+    y0 = matvec(x[:, 0])
+
+    # Result buffer (column-major, such that columns are written contiguously)
+    y = np.empty((y0.shape[0], x.shape[1]), dtype=y0.dtype, order="F")
+
+    # Fill buffer
+    y[:, 0] = y0
+
+    for j in range(1, x.shape[1]):
+        y[:, j] = matvec(x[:, j])
+
+    return y
+
+
+def _apply_rmatvec_to_rows(
+    rmatvec: Callable[[np.ndarray], np.ndarray], x: np.ndarray
+) -> np.ndarray:
+    x = np.ascontiguousarray(x)
+
+    # Shape and dtype inference
+    y0 = rmatvec(x[0, :])
+
+    # Result buffer
+    y = np.empty((x.shape[0], y0.shape[0]), dtype=y0.dtype)
+
+    # Fill buffer
+    y[0, :] = y0
+
+    for i in range(1, x.shape[0]):
+        y[i, :] = rmatvec(x[i, :])
+
+    return y
+
+
 class TransposedLinearOperator(LinearOperator):
     """Transposition of a linear operator."""
 
@@ -798,7 +1039,7 @@ class _InverseLinearOperator(LinearOperator):
             shape=self._linop.shape,
             dtype=self._linop._inexact_dtype,
             matmul=LinearOperator.broadcast_matmat(self._matmat),
-            rmatmul=lambda x: tmatmul(x[..., np.newaxis])[..., 0],
+            rmatmul=lambda x: np.swapaxes(tmatmul(np.swapaxes(x, -1, -2)), -1, -2),
             transpose=lambda: TransposedLinearOperator(self, matmul=tmatmul),
             inverse=lambda: self._linop,
             det=lambda: 1 / self._linop.det(),
@@ -898,8 +1139,9 @@ class Matrix(LinearOperator):
             shape = self.A.shape
             dtype = self.A.dtype
 
-            matmul = LinearOperator.broadcast_matmat(lambda x: self.A @ x)
-            rmatmul = LinearOperator.broadcast_rmatmat(lambda x: x @ self.A)
+            # Bind the sparse products directly to avoid an extra Python frame per call
+            matmul = LinearOperator.broadcast_matmat(self.A.__matmul__)
+            rmatmul = LinearOperator.broadcast_rmatmat(self.A.__rmatmul__)
             todense = self.A.toarray
             inverse = self._sparse_inv
             trace = lambda: self.A.diagonal().sum()
@@ -1033,6 +1275,33 @@ class Identity(LinearOperator):
         else:
             return Identity(self.shape, dtype=dtype)
 
+    def __matmul__(
+        self, other: BinaryOperandType
+    ) -> Union["LinearOperator", np.ndarray]:
+        # Avoid reshaping and dtype promotion if the operand can be returned as is
+        if (
+            isinstance(other, np.ndarray)
+            and other.ndim >= 1
+            and other.shape[-2 if other.ndim > 1 else 0] == self.shape[1]
+            and np.promote_types(self.dtype, other.dtype) == other.dtype
+        ):
+            return other
+
+        return super().__matmul__(other)
+
+    def __rmatmul__(
+        self, other: BinaryOperandType
+    ) -> Union["LinearOperator", np.ndarray]:
+        if (
+            isinstance(other, np.ndarray)
+            and other.ndim >= 1
+            and other.shape[-1] == self.shape[0]
+            and np.promote_types(self.dtype, other.dtype) == other.dtype
+        ):
+            return other
+
+        return super().__rmatmul__(other)
+
     def __eq__(self, other: LinearOperator) -> bool:
         return self._is_type_shape_dtype_equal(other)
 
@@ -1070,8 +1339,7 @@ class Selection(LinearOperator):
         return self._indices
 
     def _todense(self):
-        res = np.eye(self.shape[1], self.shape[1])
-        return _selection_matmul(self.indices, res)
+        return _selection_matmul(self.indices, _eye(self.shape[1], self.dtype))
 
 
 def _selection_matmul(indices, M):
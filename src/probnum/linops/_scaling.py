@@ -308,15 +308,24 @@ class Scaling(_linear_operator.LinearOperator):
 class Zero(_linear_operator.LinearOperator):
     def __init__(self, shape, dtype=np.float64):
 
-        matmul = lambda x: np.zeros(x.shape, np.result_type(x, self.dtype))
-        rmatmul = lambda x: np.zeros(x.shape, np.result_type(x, self.dtype))
-        apply = lambda x, axis: np.zeros(x.shape, np.result_type(x, self.dtype))
+        # Products with the zero operator never touch the operand's entries
+        matmul = lambda x: np.zeros(
+            x.shape[:-2] + (self.shape[0], x.shape[-1]),
+            np.result_type(x.dtype, self.dtype),
+        )
+        rmatmul = lambda x: np.zeros(
+            x.shape[:-1] + (self.shape[1],), np.result_type(x.dtype, self.dtype)
+        )
+        apply = lambda x, axis: np.zeros(
+            x.shape[:axis] + (self.shape[0],) + x.shape[axis + 1 :],
+            np.result_type(x.dtype, self.dtype),
+        )
         todense = lambda: np.zeros(shape=shape, dtype=dtype)
         rank = lambda: np.intp(0)
         eigvals = lambda: np.zeros(shape=(shape[0],), dtype=dtype)
-        det = lambda: np.zeros(shape=(), dtype=dtype)
+        det = lambda: probnum.utils.as_numpy_scalar(0.0, dtype=self._inexact_dtype)
 
-        trace = lambda: np.zeros(shape=(), dtype=dtype)
+        trace = lambda: probnum.utils.as_numpy_scalar(0, dtype=self.dtype)
 
         super().__init__(
             shape,
@@ -325,9 +334,14 @@ class Zero(_linear_operator.LinearOperator):
             rmatmul=rmatmul,
             apply=apply,
             todense=todense,
-            transpose=lambda: self,
+            transpose=lambda: Zero(shape=(shape[1], shape[0]), dtype=dtype),
+            inverse=self._inv,
             rank=rank,
             eigvals=eigvals,
             det=det,
             trace=trace,
         )
+
+    @staticmethod
+    def _inv() -> "Zero":
+        raise np.linalg.LinAlgError("The operator is singular.")
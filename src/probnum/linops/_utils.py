@@ -29,9 +29,9 @@ def aslinop(A: LinearOperatorLike) -> _linear_operator.LinearOperator:
 
     Notes
     -----
-    If `A` has no `.dtype` attribute, the data type is determined by calling
-    :func:`LinearOperator.matvec()` - set the `.dtype` attribute to prevent this
-    call upon the linear operator creation.
+    If `A` has no `.dtype` attribute, the data type is assumed to be
+    :class:`numpy.double`, i.e. it is not inferred by calling `.matvec`. Set the
+    `.dtype` attribute to override this.
 
     Examples
     --------
@@ -46,10 +46,24 @@ def aslinop(A: LinearOperatorLike) -> _linear_operator.LinearOperator:
     elif isinstance(A, (np.ndarray, scipy.sparse.spmatrix)):
         return _linear_operator.Matrix(A=A)
     elif isinstance(A, scipy.sparse.linalg.LinearOperator):
+        # Unwrap operators backed by an explicit matrix (e.g. the result of
+        # `scipy.sparse.linalg.aslinearoperator`), such that `todense` and arithmetic
+        # do not have to go through `matmat`
+        if isinstance(A, scipy.sparse.linalg.interface.MatrixLinearOperator):
+            return _linear_operator.Matrix(A=A.A)
+
         return _linear_operator.LinearOperator(
             A.shape,
             A.dtype,
             matmul=_linear_operator.LinearOperator.broadcast_matmat(A.matmat),
         )
+    elif hasattr(A, "shape") and hasattr(A, "matvec"):
+        dtype = getattr(A, "dtype", None)
+
+        return _linear_operator.LinearOperator(
+            A.shape,
+            np.double if dtype is None else dtype,
+            matmul=_linear_operator.LinearOperator.broadcast_matvec(A.matvec),
+        )
     else:
         raise TypeError(f"Cannot interpret {A} as a linear operator.")
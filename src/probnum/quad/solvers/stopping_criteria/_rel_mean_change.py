@@ -1,7 +1,5 @@
 """Stopping criterion based on the relative change of the successive integral estimators."""
 
-import numpy as np
-
 from probnum.quad.solvers.bq_state import BQState
 from probnum.quad.solvers.stopping_criteria import BQStoppingCriterion
 from probnum.typing import FloatArgType
@@ -27,11 +25,8 @@ class RelativeMeanChange(BQStoppingCriterion):
         self.rel_tol = rel_tol
 
     def __call__(self, bq_state: BQState) -> bool:
-        integral_belief = bq_state.integral_belief
-        return (
-            np.abs(
-                (integral_belief.mean - bq_state.previous_integral_beliefs[-1].mean)
-                / integral_belief.mean
-            )
-            <= self.rel_tol
-        )
+        # Scalar arithmetic on the integral estimates; the tolerance is scaled instead
+        # of dividing by the (possibly zero) current estimate
+        current_mean = float(bq_state.integral_belief.mean)
+        previous_mean = float(bq_state.previous_integral_beliefs[-1].mean)
+        return abs(current_mean - previous_mean) <= self.rel_tol * abs(current_mean)
@@ -0,0 +1,52 @@
+"""Stochastic trace estimators."""
+
+import numpy as np
+
+from probnum import linops
+
+__all__ = ["trace_hutchinson"]
+
+
+def trace_hutchinson(
+    A: linops.LinearOperatorLike, rng: np.random.Generator, num_probes: int = 32
+) -> np.floating:
+    r"""Estimate the trace of a square matrix from matrix-vector products with random
+    probe vectors.
+
+    Computes the Hutchinson estimator :math:`\frac{1}{m} \sum_{i=1}^m z_i^\top A z_i`
+    with :math:`m` independent Rademacher vectors :math:`z_i`. The estimator is
+    unbiased and costs a single product of :math:`A` with an :math:`n \times m` matrix,
+    instead of the :math:`n` matrix-vector products needed to compute the trace of an
+    implicitly defined matrix exactly.
+
+    Parameters
+    ----------
+    A :
+        *shape=(n, n)* -- Square matrix or linear operator supporting products
+        ``A @ Z`` with matrices ``Z``.
+    rng :
+        Random number generator used to draw the probe vectors.
+    num_probes :
+        Number of probe vectors :math:`m`.
+
+    Returns
+    -------
+    Estimate of the trace of ``A``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from probnum.utils.linalg import trace_hutchinson
+    >>> rng = np.random.default_rng(seed=42)
+    >>> A = np.diag(np.arange(1.0, 101.0))
+    >>> np.abs(trace_hutchinson(A, rng, num_probes=8) - np.trace(A)) < 1e-10
+    True
+    """
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError(f"The matrix must be square, but has shape {A.shape}.")
+    if num_probes < 1:
+        raise ValueError("The number of probe vectors must be positive.")
+
+    Z = rng.choice([-1.0, 1.0], size=(A.shape[1], num_probes))
+
+    return np.vdot(Z, A @ Z) / num_probes
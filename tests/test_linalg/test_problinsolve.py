@@ -1,6 +1,7 @@
 """Tests for linear solvers."""
 import os
 import unittest
+import warnings
 
 import numpy as np
 import scipy.sparse
@@ -319,6 +320,250 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
                     msg="Solution for matrixvariate prior does not match true solution.",
                 )
 
+    def test_indefinite_prior_mean(self):
+        """A prior mean of A which is invertible but not positive definite is inverted
+        to obtain the prior mean of its inverse."""
+        np.random.seed(1)
+        n = 10
+        A = np.random.rand(n, n)
+        A = A.dot(A.T) + n * np.eye(n)
+        b = np.random.rand(n)
+        A0_mean = np.diag(np.concatenate(([-1.0], np.ones(n - 1))))
+        A0 = randvars.Normal(mean=A0_mean, cov=linops.SymmetricKronecker(A=A))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            x, _, _, _ = linalg.problinsolve(A=A, b=b, A0=A0)
+
+        self.assertAllClose(x.mean, np.linalg.solve(A, b), rtol=1e-6, atol=1e-6)
+
+    def test_dense_prior_not_modified(self):
+        """Dense prior means and covariance factors are updated in-place by the
+        solver, which must not modify the arrays passed by the user."""
+        np.random.seed(1)
+        n = 10
+        A = np.random.rand(n, n)
+        A = A.dot(A.T) + n * np.eye(n)
+        b = np.random.rand(n)
+        A0_mean = np.eye(n)
+        Ainv0_mean = np.eye(n)
+        A0 = randvars.Normal(mean=A0_mean, cov=linops.SymmetricKronecker(A=A))
+        Ainv0 = randvars.Normal(
+            mean=Ainv0_mean, cov=linops.SymmetricKronecker(A=np.eye(n))
+        )
+
+        x, _, _, _ = linalg.problinsolve(A=A, b=b, A0=A0, Ainv0=Ainv0)
+
+        self.assertArrayEqual(A0_mean, np.eye(n))
+        self.assertArrayEqual(Ainv0_mean, np.eye(n))
+        self.assertAllClose(x.mean, np.linalg.solve(A, b), rtol=1e-6, atol=1e-6)
+
+    def test_x0_not_modified(self):
+        """The solution estimate is updated in-place by the solver, which must not
+        modify the initial guess passed by the user."""
+        np.random.seed(3)
+        n = 10
+        A = np.random.rand(n, n)
+        A = A.dot(A.T) + n * np.eye(n)
+        b = np.random.rand(n)
+        x0 = np.random.rand(n)
+        x0_copy = x0.copy()
+
+        x, _, _, _ = linalg.problinsolve(A=A, b=b, x0=x0)
+
+        self.assertArrayEqual(x0, x0_copy)
+        self.assertAllClose(x.mean, np.linalg.solve(A, b), rtol=1e-6, atol=1e-6)
+
+    def test_jit_matches_python_iteration(self):
+        """The compiled iteration for dense parameters computes the same solution and
+        posterior as the Python implementation."""
+        try:
+            import numba  # pylint: disable=import-outside-toplevel,unused-import
+        except ImportError:
+            self.skipTest("numba is not installed.")
+
+        np.random.seed(2)
+        n = 12
+        A = np.random.rand(n, n)
+        A = A.dot(A.T) + n * np.eye(n)
+        b = np.random.rand(n)
+
+        def _priors():
+            A0 = randvars.Normal(mean=np.eye(n), cov=linops.SymmetricKronecker(A=A))
+            Ainv0 = randvars.Normal(
+                mean=np.eye(n), cov=linops.SymmetricKronecker(A=np.eye(n))
+            )
+            return A0, Ainv0
+
+        A0, Ainv0 = _priors()
+        x, Ahat, Ainvhat, _ = linalg.problinsolve(A=A, b=b, A0=A0, Ainv0=Ainv0)
+        A0, Ainv0 = _priors()
+        x_jit, Ahat_jit, Ainvhat_jit, _ = linalg.problinsolve(
+            A=A, b=b, A0=A0, Ainv0=Ainv0, jit=True
+        )
+
+        self.assertAllClose(x_jit.mean, x.mean, rtol=1e-8, atol=1e-10)
+        self.assertAllClose(Ahat_jit.mean, Ahat.mean, rtol=1e-8, atol=1e-10)
+        self.assertAllClose(Ainvhat_jit.mean, Ainvhat.mean, rtol=1e-8, atol=1e-10)
+        self.assertAllClose(
+            Ainvhat_jit.cov.todense(), Ainvhat.cov.todense(), rtol=1e-8, atol=1e-10
+        )
+
+    def test_callback_without_posterior(self):
+        """Callbacks which do not take the posterior beliefs as parameters are passed
+        ``None`` for them and the solver output is unaffected."""
+        A, f = self.poisson_linear_system
+        received = []
+
+        def callback_resid(sk, resid, **kwargs):
+            received.append((kwargs["xk"], kwargs["Ak"], kwargs["Ainvk"]))
+
+        x, _, _, _ = linalg.problinsolve(A=A, b=f)
+        x_cb, _, _, _ = linalg.problinsolve(A=A, b=f, callback=callback_resid)
+
+        self.assertGreater(len(received), 0)
+        for beliefs in received:
+            self.assertEqual(beliefs, (None, None, None))
+        self.assertAllClose(x_cb.mean, x.mean)
+
+    def test_callback_partial_posterior(self):
+        """Only the posterior beliefs which are parameters of the callback are
+        computed and the final output is complete."""
+        A, f = self.poisson_linear_system
+        received = []
+
+        def callback_xk(xk, **kwargs):
+            received.append((xk, kwargs["Ak"], kwargs["Ainvk"]))
+
+        x, Ahat, Ainvhat, _ = linalg.problinsolve(A=A, b=f, callback=callback_xk)
+
+        self.assertGreater(len(received), 0)
+        for xk, Ak, Ainvk in received:
+            self.assertIsInstance(xk, randvars.Normal)
+            self.assertIsNone(Ak)
+            self.assertIsNone(Ainvk)
+        self.assertAllClose(received[-1][0].mean, x.mean)
+        self.assertIsInstance(Ahat, randvars.Normal)
+        self.assertIsInstance(Ainvhat, randvars.Normal)
+
+    def test_single_precision_covfactors(self):
+        """Storing the covariance factors in single precision keeps the solution
+        estimate accurate and the trace of the solution covariance non-negative."""
+        np.random.seed(2)
+        n = 30
+        A = np.random.rand(n, n)
+        A = A.dot(A.T) + n * np.eye(n)
+        b = np.random.rand(n)
+
+        A0 = randvars.Normal(mean=np.eye(n), cov=linops.SymmetricKronecker(A=A))
+        Ainv0 = randvars.Normal(
+            mean=np.eye(n), cov=linops.SymmetricKronecker(A=np.eye(n))
+        )
+
+        x, _, _, info = linalg.problinsolve(
+            A=A, b=b, A0=A0, Ainv0=Ainv0, covfactor_dtype=np.float32
+        )
+
+        self.assertEqual(x.mean.dtype, np.double)
+        self.assertAllClose(x.mean, np.linalg.solve(A, b), rtol=1e-5, atol=1e-6)
+        self.assertTrue(np.isfinite(info["trace_sol_cov"]))
+        self.assertGreaterEqual(info["trace_sol_cov"], 0.0)
+
+    def test_step_stagnation(self):
+        """Without tolerances the solver stops once the steps no longer change the
+        solution estimate instead of running until the maximum number of
+        iterations."""
+        np.random.seed(6)
+        n = 10
+        A = np.random.rand(n, n)
+        A = A.dot(A.T) + n * np.eye(n)
+        b = np.random.rand(n)
+
+        x, _, _, info = linalg.problinsolve(A=A, b=b, atol=0.0, rtol=0.0, maxiter=1000)
+
+        self.assertEqual(info["conv_crit"], "step_stagnation")
+        self.assertLess(info["iter"], 1000)
+        self.assertAllClose(x.mean, np.linalg.solve(A, b), rtol=1e-8)
+
+    def test_zero_curvature(self):
+        """The solver stops if a search direction lies in the null space of the
+        system matrix."""
+        A = np.diag([0.0, 1.0, 2.0, 3.0, 4.0])
+        b = np.array([1.0, 0.0, 0.0, 0.0, 0.0])
+
+        _, _, _, info = linalg.problinsolve(A=A, b=b)
+
+        self.assertEqual(info["conv_crit"], "zero_curvature")
+
+    def test_step_stagnation_jit(self):
+        """The compiled iteration stops on stagnating steps with the same beliefs as
+        the Python iteration."""
+        try:
+            import numba  # pylint: disable=import-outside-toplevel,unused-import
+        except ImportError:
+            self.skipTest("numba is not installed.")
+
+        np.random.seed(6)
+        n = 10
+        A = np.random.rand(n, n)
+        A = A.dot(A.T) + n * np.eye(n)
+        b = np.random.rand(n)
+
+        def _priors():
+            A0 = randvars.Normal(mean=np.eye(n), cov=linops.SymmetricKronecker(A=A))
+            Ainv0 = randvars.Normal(
+                mean=np.eye(n), cov=linops.SymmetricKronecker(A=np.eye(n))
+            )
+            return A0, Ainv0
+
+        A0, Ainv0 = _priors()
+        x, _, Ainv, info = linalg.problinsolve(
+            A=A, b=b, A0=A0, Ainv0=Ainv0, atol=0.0, rtol=0.0, maxiter=1000
+        )
+        A0, Ainv0 = _priors()
+        x_jit, _, Ainv_jit, info_jit = linalg.problinsolve(
+            A=A, b=b, A0=A0, Ainv0=Ainv0, atol=0.0, rtol=0.0, maxiter=1000, jit=True
+        )
+
+        self.assertEqual(info_jit["conv_crit"], "step_stagnation")
+        self.assertEqual(info_jit["iter"], info["iter"])
+        self.assertAllClose(x_jit.mean, x.mean)
+        self.assertAllClose(Ainv_jit.mean, Ainv.mean)
+
+    def test_asymmetric_system_matrix_residual(self):
+        """The reported residual is the true residual even if the system matrix is
+        not exactly symmetric."""
+        np.random.seed(7)
+        n = 20
+        A = np.random.rand(n, n)
+        A = A.dot(A.T) + n * np.eye(n)
+        A[0, 5] += 1.0
+        b = np.random.rand(n)
+
+        x, _, _, info = linalg.problinsolve(A=A, b=b)
+
+        self.assertAllClose(
+            info["resid_l2norm"], np.linalg.norm(A @ x.mean - b), rtol=1e-6
+        )
+
+    def test_parallel_matvecs(self):
+        """Evaluating the products with both beliefs in parallel yields the same
+        posterior as the serial iteration."""
+        np.random.seed(5)
+        n = 600
+        A = np.random.rand(n, n)
+        A = A.dot(A.T) + n * np.eye(n)
+        b = np.random.rand(n)
+
+        solver_cls = linalg.solvers.matrixbased.SymmetricMatrixBasedSolver
+        x_serial, _, Ainv_serial, _ = solver_cls(A=A, b=b).solve(atol=1e-6, rtol=1e-6)
+        x_parallel, _, Ainv_parallel, _ = solver_cls(
+            A=A, b=b, parallel_matvecs=True
+        ).solve(atol=1e-6, rtol=1e-6)
+
+        self.assertAllClose(x_parallel.mean, x_serial.mean)
+        self.assertAllClose(Ainv_parallel.mean.todense(), Ainv_serial.mean.todense())
+
     def test_searchdir_conjugacy(self):
         """Search directions should remain A-conjugate up to machine precision, i.e. s_i^T A s_j = 0 for i != j."""
         searchdirs = []
@@ -423,9 +668,25 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
                 )
                 self.assertAlmostEqual(
                     info["trace_sol_cov"],
-                    x_est.cov.trace(),
+                    np.trace(x_est.cov.todense()),
                     msg="Iteratively computed trace not equal to trace of solution covariance.",
                 )
+                self.assertEqual(info["trace_sol_cov"], x_est.cov.trace())
+
+    def test_estimated_covariance_trace(self):
+        """If the trace of the prior covariance factor is estimated, the estimate is
+        only used by the stopping criteria and not reported as the trace of the
+        solution covariance."""
+        A, b, _ = self.rbf_kernel_linear_system
+
+        x_est, _, _, info = linalg.problinsolve(
+            A=A, b=b, trace_estimator=lambda C: 2.0 * C.trace()
+        )
+
+        self.assertFalse(
+            np.isclose(info["trace_sol_cov"], x_est.cov.trace(), rtol=1e-2, atol=0.0)
+        )
+        self.assertAllClose(x_est.cov.trace(), np.trace(x_est.cov.todense()))
 
     def test_uncertainty_calibration_error(self):
         """Test if the available uncertainty calibration procedures affect the error of
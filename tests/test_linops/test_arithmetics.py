@@ -23,6 +23,7 @@ from probnum.linops._kronecker import (
 from probnum.linops._linear_operator import (
     Embedding,
     Identity,
+    LinearOperator,
     Matrix,
     Selection,
     TransposedLinearOperator,
@@ -97,6 +98,9 @@ def get_linop(linop_type):
         return _TypeCastLinearOperator(
             linop=Matrix(np.random.rand(4, 4)), dtype=np.float32
         )
+    elif linop_type is LinearOperator:
+        _mat = np.random.rand(4, 4)
+        return LinearOperator(shape=(4, 4), dtype=np.double, matmul=lambda x: _mat @ x)
     elif linop_type is np.number:
         return 1.3579
     else:
@@ -262,6 +266,36 @@ def test_selection_embedding():
     assert product2.shape[1] == emb2.shape[1]
 
 
+def test_identity_short_circuits():
+    idty = Identity(4)
+    linop = get_linop(LinearOperator)
+
+    assert idty @ linop is linop
+    assert linop @ idty is linop
+
+    scaled = 2.5 * idty
+    assert isinstance(scaled, Scaling)
+    assert scaled.is_isotropic
+    assert scaled.dtype == idty.dtype
+    np.testing.assert_allclose(scaled.todense(), 2.5 * np.eye(4))
+
+    assert isinstance(idty * 3, Scaling)
+    assert (idty * 3).dtype == idty.dtype
+
+
+def test_nested_scaling_collapses():
+    matrix = get_linop(Matrix)[0]
+    scaled = ScaledLinearOperator(linop=matrix, scalar=3.0)
+
+    for res in (2.0 * scaled, scaled * 2.0, -scaled):
+        assert isinstance(res, ScaledLinearOperator)
+        assert res._linop is matrix
+
+    np.testing.assert_allclose((2.0 * scaled).todense(), 6.0 * matrix.A)
+    np.testing.assert_allclose((-scaled).todense(), -3.0 * matrix.A)
+    assert -NegatedLinearOperator(linop=matrix) is matrix
+
+
 def test_lazy_matrix_matrix_matmul_option():
     mat1 = get_linop(Matrix)[0]
     mat2 = get_linop(Matrix)[0]
@@ -296,3 +330,52 @@ def test_equality():
 
         else:
             assert s1 != s2
+
+
+def test_sum_does_not_modify_operand():
+    sum_linop = Identity(3) + Matrix(np.ones((3, 3)))
+    x = np.arange(3.0)
+
+    assert isinstance(sum_linop, SumLinearOperator)
+
+    np.testing.assert_allclose(sum_linop @ x, x + x.sum())
+    np.testing.assert_allclose(x @ sum_linop, x + x.sum())
+    np.testing.assert_array_equal(x, np.arange(3.0))
+
+
+def test_mul_array_raises():
+    linop = Matrix(np.eye(3))
+
+    with pytest.raises(TypeError):
+        linop * np.ones(3)  # pylint: disable=pointless-statement
+
+    with pytest.raises(TypeError):
+        np.ones(3) * linop  # pylint: disable=pointless-statement
+
+    assert isinstance(np.array(2.0) * linop, LinearOperator)
+
+
+def test_mul_zero_annihilates():
+    linop = Matrix(np.arange(6.0).reshape(2, 3))
+
+    for zero_linop in (0 * linop, linop * 0.0, 3.0 * Zero((2, 3))):
+        assert isinstance(zero_linop, Zero)
+        assert zero_linop.shape == linop.shape
+        np.testing.assert_array_equal(zero_linop @ np.ones(3), np.zeros(2))
+
+
+def test_product_results_are_independent():
+    rng = np.random.default_rng(42)
+    matrices = [
+        rng.normal(size=(3, 4)),
+        rng.normal(size=(4, 5)),
+        rng.normal(size=(5, 2)),
+    ]
+    prod_linop = ProductLinearOperator(*(Matrix(A) for A in matrices))
+    x1, x2 = rng.normal(size=(2, 2))
+
+    y1 = prod_linop @ x1
+    y2 = prod_linop @ x2
+
+    np.testing.assert_allclose(y1, matrices[0] @ matrices[1] @ matrices[2] @ x1)
+    np.testing.assert_allclose(y2, matrices[0] @ matrices[1] @ matrices[2] @ x2)
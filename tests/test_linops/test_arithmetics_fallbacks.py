@@ -1,5 +1,8 @@
 """Tests for linear operator arithmetics fallbacks."""
 
+import concurrent.futures
+import copy
+
 import numpy as np
 import pytest
 
@@ -40,3 +43,28 @@ def test_scaled_linop(rand_spd_mat, scalar):
     assert np.allclose(
         scaled2.inv().todense(), (1.0 / scalar) * scaled2._linop.inv().todense()
     )
+
+
+def test_product_linop_concurrent_matmul(rng):
+    factors = [Matrix(rng.normal(size=(300, 300))) for _ in range(3)]
+    product = factors[0] @ factors[1] @ factors[2]
+    dense = product.todense()
+
+    xs = [rng.normal(size=(300, 3)) for _ in range(64)]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda x: product @ x, xs))
+
+    for x, result in zip(xs, results):
+        np.testing.assert_allclose(result, dense @ x)
+
+
+def test_product_linop_deepcopy(rng):
+    product = Matrix(rng.normal(size=(5, 5))) @ Matrix(rng.normal(size=(5, 5)))
+    x = rng.normal(size=(5, 2))
+    expected = product @ x
+
+    product_copy = copy.deepcopy(product)
+
+    np.testing.assert_allclose(product_copy @ x, expected)
+    np.testing.assert_allclose(product @ x, expected)
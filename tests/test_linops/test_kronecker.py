@@ -61,3 +61,13 @@ def test_symmetrize(n):
         np.shape(Z),
         err_msg="Symmetrized matrix columns do not have the right shape.",
     )
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int32])
+def test_identity_kronecker_dtype(dtype):
+    B = np.arange(4, dtype=dtype).reshape(2, 2)
+    linop = pn.linops.IdentityKronecker(3, B)
+
+    assert linop.dtype == B.dtype
+    assert linop.A.dtype == B.dtype
+    np.testing.assert_array_equal(linop.todense(), np.kron(np.eye(3, dtype=dtype), B))
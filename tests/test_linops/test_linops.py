@@ -4,6 +4,7 @@ from typing import Optional, Tuple, Union
 import numpy as np
 import pytest
 import pytest_cases
+import scipy.sparse.linalg
 
 import probnum as pn
 
@@ -189,6 +190,14 @@ def test_todense(linop: pn.linops.LinearOperator, matrix: np.ndarray):
     np.testing.assert_allclose(linop_dense, matrix)
 
 
+@pytest_cases.parametrize_with_cases("linop,matrix", cases=case_modules)
+def test_transpose_matmul(linop: pn.linops.LinearOperator, matrix: np.ndarray):
+    x = np.arange(3 * linop.shape[0], dtype=np.double).reshape(linop.shape[0], 3)
+
+    np.testing.assert_allclose(linop.T @ x, matrix.T @ x)
+    np.testing.assert_allclose(x.T @ linop, x.T @ matrix)
+
+
 @pytest_cases.parametrize_with_cases("linop,matrix", cases=case_modules)
 def test_rank(linop: pn.linops.LinearOperator, matrix: np.ndarray):
     linop_rank = linop.rank()
@@ -351,3 +360,93 @@ def test_inv(linop: pn.linops.LinearOperator, matrix: np.ndarray):
     else:
         with pytest.raises(np.linalg.LinAlgError):
             linop.inv()
+
+
+def test_broadcast_jit_matvec(rng: np.random.Generator):
+    numba = pytest.importorskip("numba")
+
+    matrix = rng.normal(size=(4, 3))
+
+    @numba.njit
+    def _matvec(vec):
+        return matrix @ vec
+
+    linop = pn.linops.LinearOperator(
+        shape=matrix.shape,
+        dtype=matrix.dtype,
+        matmul=pn.linops.LinearOperator.broadcast_jit_matvec(
+            _matvec, shape=matrix.shape, dtype=matrix.dtype
+        ),
+    )
+
+    vec = rng.normal(size=3)
+    mat = rng.normal(size=(3, 5))
+    mat_stack = rng.normal(size=(2, 3, 5))
+
+    np.testing.assert_allclose(linop @ vec, matrix @ vec)
+    np.testing.assert_allclose(linop @ mat, matrix @ mat)
+    np.testing.assert_allclose(linop @ mat_stack, matrix @ mat_stack)
+    assert (linop @ np.empty((3, 0))).shape == (4, 0)
+
+
+def test_aslinop_scipy_operator_with_matrix_attribute():
+    """Only operators which are known to represent their ``A`` attribute are
+    unwrapped."""
+
+    class _InverseOperator(scipy.sparse.linalg.LinearOperator):
+        def __init__(self, A):
+            super().__init__(dtype=A.dtype, shape=A.shape)
+            self.A = A
+
+        def _matvec(self, x):
+            return np.linalg.solve(self.A, x)
+
+    matrix = np.diag([1.0, 2.0, 4.0])
+    linop = pn.linops.aslinop(_InverseOperator(matrix))
+
+    np.testing.assert_allclose(linop.todense(), np.linalg.inv(matrix))
+
+
+def test_todense_does_not_expose_identity_buffer():
+    linop = pn.linops.LinearOperator(shape=(3, 3), dtype=np.double, matmul=lambda x: x)
+
+    dense = linop.todense(cache=False)
+    dense[0, 1] = 2.0
+
+    np.testing.assert_array_equal(linop.todense(cache=False), np.eye(3))
+
+
+def test_todense_inplace_matmul():
+    def _matmul(x):
+        x *= 2.0
+        return x
+
+    linop = pn.linops.LinearOperator(shape=(3, 3), dtype=np.double, matmul=_matmul)
+
+    np.testing.assert_array_equal(linop.todense(), 2.0 * np.eye(3))
+
+
+@pytest_cases.parametrize_with_cases("linop,matrix", cases=case_modules)
+def test_specialize(linop: pn.linops.LinearOperator, matrix: np.ndarray):
+    pytest.importorskip("numba")
+
+    specialized = linop.specialize()
+
+    assert specialized.shape == linop.shape
+    assert specialized.dtype == linop.dtype
+
+    x = np.arange(2 * linop.shape[1], dtype=np.double).reshape(linop.shape[1], 2)
+
+    np.testing.assert_allclose(specialized @ x, matrix @ x)
+    np.testing.assert_allclose(specialized @ x[:, 0], matrix @ x[:, 0])
+
+
+def test_specialize_non_finite_entries():
+    pytest.importorskip("numba")
+
+    matrix = np.array([[1.0, np.inf], [np.nan, 0.0], [-np.inf, 2.0]])
+    specialized = pn.linops.Matrix(matrix).specialize()
+
+    x = np.array([2.0, 3.0])
+
+    np.testing.assert_array_equal(specialized @ x, matrix @ x)
@@ -3,6 +3,7 @@ from typing import Tuple
 import numpy as np
 import pytest
 import scipy.sparse
+import scipy.sparse.linalg
 
 import probnum as pn
 
@@ -26,11 +27,50 @@ def case_matvec(matrix: np.ndarray) -> Tuple[pn.linops.LinearOperator, np.ndarra
     return linop, matrix
 
 
+@pytest.mark.parametrize("matrix", matrices)
+def case_matvec_rmatvec(
+    matrix: np.ndarray,
+) -> Tuple[pn.linops.LinearOperator, np.ndarray]:
+    @pn.linops.LinearOperator.broadcast_matvec
+    def _matmul(vec: np.ndarray):
+        return matrix @ vec
+
+    @pn.linops.LinearOperator.broadcast_rmatvec
+    def _rmatmul(vec: np.ndarray):
+        return vec @ matrix
+
+    linop = pn.linops.LinearOperator(
+        shape=matrix.shape, dtype=matrix.dtype, matmul=_matmul, rmatmul=_rmatmul
+    )
+
+    return linop, matrix
+
+
 @pytest.mark.parametrize("matrix", matrices)
 def case_matrix(matrix: np.ndarray) -> Tuple[pn.linops.LinearOperator, np.ndarray]:
     return pn.linops.Matrix(matrix), matrix
 
 
+@pytest.mark.parametrize("matrix", matrices)
+def case_scipy_linop(matrix: np.ndarray) -> Tuple[pn.linops.LinearOperator, np.ndarray]:
+    return pn.linops.aslinop(scipy.sparse.linalg.aslinearoperator(matrix)), matrix
+
+
+@pytest.mark.parametrize("matrix", matrices)
+def case_duck_typed_linop(
+    matrix: np.ndarray,
+) -> Tuple[pn.linops.LinearOperator, np.ndarray]:
+    class _MatVec:
+        shape = matrix.shape
+        dtype = matrix.dtype
+
+        @staticmethod
+        def matvec(vec: np.ndarray) -> np.ndarray:
+            return matrix @ vec
+
+    return pn.linops.aslinop(_MatVec()), matrix
+
+
 @pytest.mark.parametrize("n", [3, 4, 8, 12, 15])
 def case_identity(n: int) -> Tuple[pn.linops.LinearOperator, np.ndarray]:
     return pn.linops.Identity(shape=n), np.eye(n)
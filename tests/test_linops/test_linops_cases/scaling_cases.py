@@ -33,3 +33,8 @@ def case_isotropic_scaling(
     n: int, scalar
 ) -> Tuple[pn.linops.LinearOperator, np.ndarray]:
     return pn.linops.Scaling(scalar, shape=n), np.diag(np.full((n,), scalar))
+
+
+@pytest.mark.parametrize("shape", [(3, 3), (2, 5), (4, 1)])
+def case_zero(shape: Tuple[int, int]) -> Tuple[pn.linops.LinearOperator, np.ndarray]:
+    return pn.linops.Zero(shape), np.zeros(shape)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import probnum as pn
+import probnum.utils.linalg as utlin
+from probnum.problems.zoo.linalg import random_spd_matrix
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(seed=42)
+
+
+@pytest.fixture
+def spdmat(rng):
+    return random_spd_matrix(rng, dim=50)
+
+
+def test_trace_hutchinson_diagonal_exact(rng):
+    """For diagonal matrices every Rademacher probe recovers the trace exactly."""
+    A = np.diag(rng.normal(size=20))
+    np.testing.assert_allclose(
+        utlin.trace_hutchinson(A, rng, num_probes=1), np.trace(A)
+    )
+
+
+def test_trace_hutchinson_converges(spdmat, rng):
+    """The estimate is close to the trace for many probe vectors."""
+    estimate = utlin.trace_hutchinson(spdmat, rng, num_probes=10000)
+    np.testing.assert_allclose(estimate, np.trace(spdmat), rtol=0.05)
+
+
+def test_trace_hutchinson_linear_operator(spdmat):
+    """Linear operators and dense matrices yield the same estimate for the same
+    probes."""
+    expected = utlin.trace_hutchinson(spdmat, np.random.default_rng(1), num_probes=5)
+    received = utlin.trace_hutchinson(
+        pn.linops.Matrix(spdmat), np.random.default_rng(1), num_probes=5
+    )
+    np.testing.assert_allclose(received, expected)
+
+
+def test_trace_hutchinson_non_square_raises_error(rng):
+    with pytest.raises(ValueError):
+        utlin.trace_hutchinson(np.ones((3, 4)), rng)